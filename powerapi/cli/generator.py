@@ -36,7 +36,7 @@ from powerapi.database.influxdb2 import InfluxDB2
 from powerapi.exception import PowerAPIException
 from powerapi.report import HWPCReport, PowerReport, ControlReport, ProcfsReport
 from powerapi.database import MongoDB, CsvDB, InfluxDB, OpenTSDB, SocketDB, PrometheusDB, DirectPrometheusDB, \
-    VirtioFSDB, FileDB
+    VirtioFSDB, FileDB, UnixSocketDB
 from powerapi.puller import PullerActor
 from powerapi.pusher import PusherActor
 from powerapi.message import StartMessage, PusherStartMessage, PullerStartMessage, SimplePusherStartMessage, \
@@ -45,6 +45,14 @@ from powerapi.report_modifier.libvirt_mapper import LibvirtMapper
 from powerapi.simple_puller import SimplePullerActor
 from powerapi.simple_pusher import SimplePusherActor
 
+PULL_OPTIONS = {
+    'pull_batch_size': 'batch_size',
+    'pull_batch_time': 'batch_time',
+    'pull_min_interval': 'min_interval',
+    'pull_max_interval': 'max_interval',
+    'pull_report_batch': 'report_batch',
+}
+
 
 class Generator:
     """
@@ -134,6 +142,17 @@ def gen_tag_list(db_config: Dict):
     return db_config['tags'].split(',')
 
 
+def gen_socket_options(db_config: Dict):
+    """
+    Generate optional socket database parameters from config
+    """
+    options = {}
+    for option_name in ('framing', 'queue_size', 'overflow_policy'):
+        if option_name in db_config:
+            options[option_name] = db_config[option_name]
+    return options
+
+
 class DBActorGenerator(Generator):
     """
     ActorGenerator that initialise the start message with a database from config
@@ -151,7 +170,10 @@ class DBActorGenerator(Generator):
         self.db_factory = {
             'mongodb': lambda db_config: MongoDB(db_config['model'], db_config['uri'], db_config['db'],
                                                  db_config['collection']),
-            'socket': lambda db_config: SocketDB(db_config['model'], db_config['port']),
+            'socket': lambda db_config: SocketDB(db_config['model'], db_config['port'],
+                                                 **gen_socket_options(db_config)),
+            'unix_socket': lambda db_config: UnixSocketDB(db_config['model'], db_config['path'],
+                                                          **gen_socket_options(db_config)),
             'csv': lambda db_config: CsvDB(db_config['model'], gen_tag_list(db_config),
                                            current_path=os.getcwd() if 'directory' not in db_config else db_config[
                                                'directory'],
@@ -231,14 +253,14 @@ class DBActorGenerator(Generator):
         db_config['model'] = model
         db = self._generate_db(db_name, db_config, main_config)
         start_message = self._start_message_factory(actor_name, db, model, main_config['stream'],
-                                                    main_config['verbose'])
+                                                    main_config['verbose'], main_config)
         actor = self._actor_factory(db_config)
         return actor, start_message
 
     def _actor_factory(self, db_config):
         raise NotImplementedError()
 
-    def _start_message_factory(self, name, db, model, stream_mode, level_logger):
+    def _start_message_factory(self, name, db, model, stream_mode, level_logger, main_config):
         raise NotImplementedError()
 
 
@@ -255,9 +277,13 @@ class PullerGenerator(DBActorGenerator):
     def _actor_factory(self, db_config):
         return PullerActor
 
-    def _start_message_factory(self, name, db, model, stream_mode, level_logger):
+    def _start_message_factory(self, name, db, model, stream_mode, level_logger, main_config):
+        pull_options = {}
+        for config_key, option_name in PULL_OPTIONS.items():
+            if config_key in main_config:
+                pull_options[option_name] = main_config[config_key]
         return PullerStartMessage('system', name, db, self.report_filter, stream_mode,
-                                  report_modifiers=self.report_modifier_list)
+                                  report_modifiers=self.report_modifier_list, **pull_options)
 
 
 class SimpleGenerator(Generator):
@@ -322,7 +348,7 @@ class PusherGenerator(DBActorGenerator):
     def _actor_factory(self, _):
         return PusherActor
 
-    def _start_message_factory(self, name, db, _model, _stream_mode, _level_logger):
+    def _start_message_factory(self, name, db, _model, _stream_mode, _level_logger, _main_config):
         return PusherStartMessage('system', name, db)
 
 
@@ -77,6 +77,53 @@ class CommonCLIParser(MainConfigParser):
             help="choose actor system implementation: multiprocQueueBase, multiprocTCPBase or simpleSystemBase",
         )
 
+        self.add_argument(
+            "pull_batch_size",
+            type=int,
+            default=100,
+            help="maximum number of reports pulled by a puller during one wakeup",
+        )
+        self.add_argument(
+            "pull_batch_time",
+            type=float,
+            default=0.5,
+            help="maximum time (in seconds) spent by a puller to pull reports during one wakeup",
+        )
+        self.add_argument(
+            "pull_min_interval",
+            type=float,
+            default=0.05,
+            help="time (in seconds) between two puller wakeups when the input is not empty",
+        )
+        self.add_argument(
+            "pull_max_interval",
+            type=float,
+            default=1.0,
+            help="maximum time (in seconds) between two puller wakeups when the input is empty",
+        )
+
+        self.add_argument(
+            "pull_report_batch",
+            flag=True,
+            action=store_true,
+            default=False,
+            help="send the reports pulled during one puller wakeup as a single message",
+        )
+
+        self.add_argument(
+            "dispatcher_shards",
+            type=int,
+            default=1,
+            help="number of dispatcher actors that share the formulas, each one runs in its own process with a "
+                 "multiprocess actor system",
+        )
+        self.add_argument(
+            "formula_hosts",
+            type=int,
+            default=0,
+            help="number of actors that run the formulas of a dispatcher, 0 to run each formula in its own actor",
+        )
+
         subparser_libvirt_mapper_modifier = SubConfigParser("libvirt_mapper")
         subparser_libvirt_mapper_modifier.add_argument(
             "u", "uri", help="libvirt daemon uri", default=""
@@ -125,6 +172,25 @@ class CommonCLIParser(MainConfigParser):
         subparser_socket_input.add_argument(
             "n", "name", help="specify puller name", default="puller_socket"
         )
+        subparser_socket_input.add_argument(
+            "f",
+            "framing",
+            help="specify how json objects are delimited in the stream : brace, ndjson or length-prefixed",
+            default="brace",
+        )
+        subparser_socket_input.add_argument(
+            "q",
+            "queue_size",
+            type=int,
+            help="specify maximum number of received reports waiting to be pulled (0 for unlimited)",
+            default=10000,
+        )
+        subparser_socket_input.add_argument(
+            "o",
+            "overflow_policy",
+            help="specify what to do when a report is received while the queue is full : block, drop-oldest or drop-newest",
+            default="block",
+        )
         subparser_socket_input.add_argument(
             "m",
             "model",
@@ -137,6 +203,44 @@ class CommonCLIParser(MainConfigParser):
             help="specify a database input : --db_input database_name ARG1 ARG2 ... ",
         )
 
+        subparser_unix_socket_input = SubConfigParser("unix_socket")
+        subparser_unix_socket_input.add_argument(
+            "p", "path", help="specify path of the unix socket file"
+        )
+        subparser_unix_socket_input.add_argument(
+            "n", "name", help="specify puller name", default="puller_unix_socket"
+        )
+        subparser_unix_socket_input.add_argument(
+            "m",
+            "model",
+            help="specify data type that will be sent through the socket",
+            default="HWPCReport",
+        )
+        subparser_unix_socket_input.add_argument(
+            "f",
+            "framing",
+            help="specify how json objects are delimited in the stream : brace, ndjson or length-prefixed",
+            default="brace",
+        )
+        subparser_unix_socket_input.add_argument(
+            "q",
+            "queue_size",
+            type=int,
+            help="specify maximum number of received reports waiting to be pulled (0 for unlimited)",
+            default=10000,
+        )
+        subparser_unix_socket_input.add_argument(
+            "o",
+            "overflow_policy",
+            help="specify what to do when a report is received while the queue is full : block, drop-oldest or drop-newest",
+            default="block",
+        )
+        self.add_subparser(
+            "input",
+            subparser_unix_socket_input,
+            help="specify a database input : --db_input database_name ARG1 ARG2 ... ",
+        )
+
         subparser_csv_input = SubConfigParser("csv")
         subparser_csv_input.add_argument(
             "f",
@@ -0,0 +1,162 @@
+# Copyright (c) 2021, INRIA
+# Copyright (c) 2021, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+import queue
+import threading
+
+from powerapi.report import BadInputData
+from .base_db import BaseDB
+
+DEFAULT_QUEUE_SIZE = 10000
+QUEUE_FULL_RETRY_DELAY = 0.01
+THREAD_JOIN_TIMEOUT = 5
+
+_END_OF_STREAM = object()
+
+
+class AsyncDBReader:
+    """
+    Run an asynchronous database in a dedicated thread that owns its event loop.
+
+    Reports produced by the database are sent to the consumer thread through a thread-safe bounded queue, so the
+    consumer can retrieve the reports that are ready without blocking. When the queue is full, the event loop waits
+    before producing new reports
+    """
+
+    def __init__(self, database: BaseDB, stream_mode: bool, queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        :param database: asynchronous database to read
+        :param stream_mode: True if stream mode is enabled
+        :param queue_size: maximum number of reports waiting to be consumed
+        """
+        self.database = database
+        self.stream_mode = stream_mode
+        self.reports = queue.Queue(maxsize=queue_size)
+        self.loop = None
+        self.thread = None
+
+        self._exhausted = False
+
+    def start(self):
+        """
+        Start the event loop thread, connect the database and start reading reports from it
+        """
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.database.connect(), self.loop).result()
+        except BaseException:
+            self._stop_loop()
+            raise
+        database_it = self.database.iter(self.stream_mode)
+        asyncio.run_coroutine_threadsafe(self._pump(database_it), self.loop)
+
+    def stop(self):
+        """
+        Stop reading reports, close the database and stop the event loop thread
+        """
+        if self.loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(THREAD_JOIN_TIMEOUT)
+        except Exception:
+            pass
+        self._stop_loop()
+
+    def get(self):
+        """
+        :return: the next report read from the database or None if no report is ready
+        :raise StopIteration: if the database will not produce reports anymore
+        :raise BadInputData: if the database read data that can't be converted into a report
+        """
+        if self._exhausted:
+            raise StopIteration()
+        try:
+            item = self.reports.get_nowait()
+        except queue.Empty:
+            return None
+
+        if item is _END_OF_STREAM:
+            self._exhausted = True
+            raise StopIteration()
+        if isinstance(item, BadInputData):
+            raise item
+        return item
+
+    def get_stats(self):
+        """
+        :return: statistics of the database completed with the number of reports waiting to be consumed
+        """
+        stats = dict(self.database.get_stats())
+        stats['ready'] = self.reports.qsize()
+        return stats
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.close()
+
+    def _stop_loop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(THREAD_JOIN_TIMEOUT)
+        self.loop = None
+
+    async def _shutdown(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.database.stop()
+
+    async def _pump(self, database_it):
+        while True:
+            try:
+                report = await database_it.__anext__()
+            except StopAsyncIteration:
+                break
+            except BadInputData as exn:
+                await self._put(exn)
+                continue
+
+            if report is None:
+                # no report was received during the database timeout
+                if self.stream_mode:
+                    continue
+                break
+            await self._put(report)
+        await self._put(_END_OF_STREAM)
+
+    async def _put(self, item):
+        while True:
+            try:
+                self.reports.put_nowait(item)
+                return
+            except queue.Full:
+                await asyncio.sleep(QUEUE_FULL_RETRY_DELAY)
@@ -26,7 +26,7 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from typing import List, Type
+from typing import List, Type, Dict
 from powerapi.report import Report
 from powerapi.exception import PowerAPIExceptionWithMessage
 
@@ -109,3 +109,9 @@ class BaseDB:
         :param reports: Batch of Serialized Report
         """
         raise NotImplementedError()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: statistics about the database usage, as a dictionary of counters (empty if not supported)
+        """
+        return {}
@@ -33,7 +33,6 @@ from typing import List, Type
 from powerapi.report.report import Report, CSV_HEADER_COMMON
 from powerapi.database.base_db import BaseDB, IterDB
 from powerapi.exception import PowerAPIException
-from powerapi.utils import utils
 
 # Array of field that will not be considered as a group
 COMMON_ROW = ['timestamp', 'sensor', 'target', 'socket', 'cpu']
@@ -103,8 +102,7 @@ class CsvIterDB(IterDB):
 
         # Save the first timestamp
         if self.filenames:
-            self.saved_timestamp = utils.timestamp_to_datetime(
-                int(self.tmp_read[self.filenames[0]]['next_line']['timestamp']))
+            self.saved_timestamp = int(self.tmp_read[self.filenames[0]]['next_line']['timestamp'])
 
     def __iter__(self):
         """
@@ -152,9 +150,8 @@ class CsvIterDB(IterDB):
                     else:
                         break
 
-                # Get the timestamp as datetime
-                row_timestamp = utils.timestamp_to_datetime(
-                    int(row['timestamp']))
+                # Get the timestamp as epoch in milliseconds
+                row_timestamp = int(row['timestamp'])
                 # If timestamp is higher, we stop here
                 if row_timestamp > current_timestamp:
                     if path_file == self.filenames[-1]:
@@ -207,7 +204,7 @@ class CsvDB(BaseDB):
 
         #: (int): allow to know if we read a new report, or the same
         #: current timestamp
-        self.saved_timestamp = utils.timestamp_to_datetime(0)
+        self.saved_timestamp = 0
         self.tags = tags
 
         self.add_files(files)
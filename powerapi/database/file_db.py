@@ -26,7 +26,6 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from datetime import datetime
 import logging
 from typing import List, Type
 import os
@@ -128,7 +127,7 @@ class FileDB(BaseDB):
         line = {
             "sensor": report.sensor,
             "target": report.target,
-            "timestamp": int(datetime.timestamp(report.timestamp) * 1000),
+            "timestamp": report.timestamp_ms,
             "power": report.power,
         }
 
@@ -114,7 +114,7 @@ class InfluxDB(BaseDB):
         data = self.report_type.to_influxdb(report, self.tags)
         for tag in data['tags']:
             data['tags'][tag] = str(data['tags'][tag])
-        self.client.write_points([data])
+        self.client.write_points([data], time_precision='ms')
 
     def save_many(self, reports: List[Report]):
         """
@@ -124,4 +124,4 @@ class InfluxDB(BaseDB):
         """
 
         data_list = list(map(lambda r: self.report_type.to_influxdb(r, self.tags), reports))
-        self.client.write_points(data_list)
+        self.client.write_points(data_list, time_precision='ms')
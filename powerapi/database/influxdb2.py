@@ -30,7 +30,7 @@ import logging
 from typing import List, Type
 from urllib.parse import urlparse
 try:
-    from influxdb_client import InfluxDBClient, WriteOptions
+    from influxdb_client import InfluxDBClient, WriteOptions, WritePrecision
     from influxdb_client.client.write_api import SYNCHRONOUS
 except ImportError:
     logging.getLogger().info("influx-client2 is not installed.")
@@ -146,4 +146,4 @@ class InfluxDB2(BaseDB):
             :param reports: Batch of data.
         """
         data_list = list(map(lambda r: self.report_type.to_influxdb(r, self.tags), reports))
-        self.write_api.write(bucket=self.bucket_name, record=data_list)
+        self.write_api.write(bucket=self.bucket_name, record=data_list, write_precision=WritePrecision.MS)
@@ -97,7 +97,7 @@ class OpenTSDB(BaseDB):
 
         :param report: Report to save
         """
-        self.client.send(self.metric_name, report.power, timestamp=int(report.timestamp.timestamp()),
+        self.client.send(self.metric_name, report.power, timestamp=report.timestamp_ms // 1000,
                          host=report.target)
 
     def save_many(self, reports: List[Report]):
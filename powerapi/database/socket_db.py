@@ -27,7 +27,9 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import asyncio
-from typing import Type, List
+import os
+import stat
+from typing import Type, List, Dict
 import json
 
 
@@ -37,6 +39,18 @@ from .base_db import IterDB, BaseDB, DBError
 
 BUFFER_SIZE = 4096
 SOCKET_TIMEOUT = 0.5
+STREAM_LIMIT = 2 ** 20
+LENGTH_PREFIX_SIZE = 4
+
+BRACE_FRAMING = 'brace'
+NDJSON_FRAMING = 'ndjson'
+LENGTH_PREFIXED_FRAMING = 'length-prefixed'
+
+DEFAULT_QUEUE_SIZE = 10000
+BLOCK_POLICY = 'block'
+DROP_OLDEST_POLICY = 'drop-oldest'
+DROP_NEWEST_POLICY = 'drop-newest'
+OVERFLOW_POLICIES = (BLOCK_POLICY, DROP_OLDEST_POLICY, DROP_NEWEST_POLICY)
 
 
 class SocketDB(BaseDB):
@@ -44,16 +58,37 @@ class SocketDB(BaseDB):
     Database that act as a server that expose a socket where data source will push data
     """
 
-    def __init__(self, report_type: Type[Report], port: int):
+    def __init__(self, report_type: Type[Report], port: int, framing: str = BRACE_FRAMING,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, overflow_policy: str = BLOCK_POLICY):
+        """
+        :param report_type: type of the reports received through the socket
+        :param port: port to bind the socket
+        :param framing: format used by data sources to delimit json objects :
+                          - brace : json objects are concatenated (delimited by counting brackets)
+                          - ndjson : json objects are separated by a newline
+                          - length-prefixed : each json object is preceded by its size, as a 4 bytes big-endian integer
+        :param queue_size: maximum number of received json objects waiting to be read (0 for an unbounded queue)
+        :param overflow_policy: what to do when a json object is received while the queue is full :
+                                  - block : stop reading the connection until the queue has room (TCP backpressure)
+                                  - drop-oldest : drop the oldest json object of the queue
+                                  - drop-newest : drop the received json object
+        """
         BaseDB.__init__(self, report_type)
         self.asynchrone = True
         self.queue = None
         self.port = port
+        self.framing = framing
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
         self.server = None
 
+        self.enqueued_count = 0
+        self.dropped_count = 0
+
     async def connect(self):
-        self.queue = asyncio.Queue()
-        self.server = await asyncio.start_server(self._gen_server_callback(), host='0.0.0.0', port=self.port)
+        callback = self._gen_server_callback()
+        self._init_queue()
+        self.server = await asyncio.start_server(callback, host='0.0.0.0', port=self.port, limit=STREAM_LIMIT)
 
     async def stop(self):
         """
@@ -65,23 +100,84 @@ class SocketDB(BaseDB):
     def iter(self, stream_mode):
         return IterSocketDB(self.report_type, stream_mode, self.queue)
 
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: number of json objects enqueued and dropped since the connection and current depth of the queue
+        """
+        return {
+            'enqueued': self.enqueued_count,
+            'dropped': self.dropped_count,
+            'depth': 0 if self.queue is None else self.queue.qsize(),
+        }
+
+    def _init_queue(self):
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise DBError('unknow queue overflow policy ' + str(self.overflow_policy))
+        self.enqueued_count = 0
+        self.dropped_count = 0
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+
+    async def _enqueue(self, json_str: str):
+        if not self.queue.full():
+            self.queue.put_nowait(json_str)
+        elif self.overflow_policy == BLOCK_POLICY:
+            await self.queue.put(json_str)
+        elif self.overflow_policy == DROP_OLDEST_POLICY:
+            self.queue.get_nowait()
+            self.dropped_count += 1
+            self.queue.put_nowait(json_str)
+        else:
+            self.dropped_count += 1
+            return
+        self.enqueued_count += 1
+
     def _gen_server_callback(self):
+        readers = {
+            BRACE_FRAMING: self._read_brace_framed_stream,
+            NDJSON_FRAMING: self._read_ndjson_stream,
+            LENGTH_PREFIXED_FRAMING: self._read_length_prefixed_stream,
+        }
+        if self.framing not in readers:
+            raise DBError('unknow socket framing ' + str(self.framing))
+        reader = readers[self.framing]
+
         async def callback(stream_reader, _):
-            stream = JsonStream(stream_reader)
-            count = 0  # If 10 times in a row we don't have a full message we stop
-            while True:
-                json_str = await stream.read_json_object()
-                if json_str is None:
-                    if count > 10:
-                        break
-                    count += 1
-                    continue
-                count = 0
-                await self.queue.put(json_str)
-                # self.queue.put(json_str)
+            await reader(stream_reader)
 
         return callback
 
+    async def _read_brace_framed_stream(self, stream_reader):
+        stream = JsonStream(stream_reader)
+        count = 0  # If 10 times in a row we don't have a full message we stop
+        while True:
+            json_strs = await stream.read_json_objects()
+            if not json_strs:
+                if count > 10:
+                    break
+                count += 1
+                continue
+            count = 0
+            for json_str in json_strs:
+                await self._enqueue(json_str)
+
+    async def _read_ndjson_stream(self, stream_reader):
+        while True:
+            line = await stream_reader.readline()
+            if not line:
+                break
+            json_str = line.strip()
+            if json_str:
+                await self._enqueue(json_str.decode('utf-8'))
+
+    async def _read_length_prefixed_stream(self, stream_reader):
+        while True:
+            try:
+                header = await stream_reader.readexactly(LENGTH_PREFIX_SIZE)
+                json_bytes = await stream_reader.readexactly(int.from_bytes(header, 'big'))
+            except asyncio.IncompleteReadError:
+                break
+            await self._enqueue(json_bytes.decode('utf-8'))
+
     def __iter__(self):
         raise DBError('Socket db don\'t support __iter__ method')
 
@@ -92,6 +188,53 @@ class SocketDB(BaseDB):
         raise DBError('Socket db don\'t support save_many method')
 
 
+class UnixSocketDB(SocketDB):
+    """
+    Database that act as a server that expose a unix domain socket where co-located data source will push data
+    """
+
+    def __init__(self, report_type: Type[Report], path: str, framing: str = BRACE_FRAMING,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, overflow_policy: str = BLOCK_POLICY):
+        """
+        :param report_type: type of the reports received through the socket
+        :param path: path of the unix socket file
+        :param framing: format used by data sources to delimit json objects (see SocketDB)
+        :param queue_size: maximum number of received json objects waiting to be read (see SocketDB)
+        :param overflow_policy: what to do when a json object is received while the queue is full (see SocketDB)
+        """
+        SocketDB.__init__(self, report_type, None, framing, queue_size, overflow_policy)
+        self.path = path
+
+    async def connect(self):
+        callback = self._gen_server_callback()
+        self._init_queue()
+        self._remove_socket_file()
+        self.server = await asyncio.start_unix_server(callback, path=self.path, limit=STREAM_LIMIT)
+
+    async def stop(self):
+        """
+        stop server connection and remove the socket file
+        """
+        await SocketDB.stop(self)
+        self._remove_socket_file()
+
+    def _remove_socket_file(self):
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __iter__(self):
+        raise DBError('Unix socket db don\'t support __iter__ method')
+
+    def save(self, report: Report):
+        raise DBError('Unix socket db don\'t support save method')
+
+    def save_many(self, reports: List[Report]):
+        raise DBError('Unix socket db don\'t support save_many method')
+
+
 class IterSocketDB(IterDB):
     """
     iterator connected to a socket that receive report from a sensor
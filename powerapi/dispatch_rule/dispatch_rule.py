@@ -45,3 +45,14 @@ class DispatchRule:
         :rtype: ([tuple]) a list formula identifier
         """
         raise NotImplementedError()
+
+    def project(self, report, formula_id):
+        """
+        return the part of the report that is needed by the formula with the given identifier
+
+        :param report:
+        :type report: powerapi.report.report.Report
+        :param tuple formula_id: identifier of the formula, returned by get_formula_id
+        :rtype: powerapi.report.report.Report : the given report, if it can't be restricted
+        """
+        return report
@@ -56,6 +56,10 @@ class HWPCDispatchRule(DispatchRule):
         self.depth = depth
         self.fields = self._set_field()
 
+        #: (dict): formula ids computed at core level for the last report of each sensor, with the shape of this
+        #: report groups
+        self._formula_id_cache = {}
+
     def _set_field(self):
         if self.depth == HWPCDepthLevel.TARGET:
             return ['target']
@@ -72,6 +76,20 @@ class HWPCDispatchRule(DispatchRule):
         if self.depth == HWPCDepthLevel.ROOT:
             return [(report.sensor,)]
 
+        if report.has_columnar_groups():
+            return self._get_formula_id_from_columnar_groups(report)
+
+        if self.depth != HWPCDepthLevel.CORE:
+            return self._get_formula_id_from_groups(report)
+
+        shape = _groups_shape(report)
+        cached_shape, id_list = self._formula_id_cache.get(report.sensor, (None, None))
+        if shape != cached_shape:
+            id_list = self._get_formula_id_from_groups(report)
+            self._formula_id_cache[report.sensor] = (shape, id_list)
+        return list(id_list)
+
+    def _get_formula_id_from_groups(self, report):
         non_shared_group = _extract_non_shared_group(report)
 
         if self.depth == HWPCDepthLevel.SOCKET:
@@ -90,6 +108,44 @@ class HWPCDispatchRule(DispatchRule):
 
         return []
 
+    def project(self, report, formula_id):
+        """
+        See :meth:`DispatchRule.project <powerapi.dispatch_rule.dispatch_rule.DispatchRule.project>`
+
+        At socket and core level, the report is restricted to the socket (and core) of the formula. Shared groups
+        that don't contain the formula core (like RAPL) keep the whole socket
+        """
+        if self.depth == HWPCDepthLevel.SOCKET:
+            return report.get_sub_report(formula_id[1])
+
+        if self.depth == HWPCDepthLevel.CORE:
+            return report.get_sub_report(formula_id[1], formula_id[2])
+
+        return report
+
+    def _get_formula_id_from_columnar_groups(self, report):
+        non_shared_group = _extract_non_shared_columnar_group(report)
+
+        if self.depth == HWPCDepthLevel.SOCKET:
+            return [(report.sensor, socket_id) for socket_id in non_shared_group.sockets]
+
+        if self.depth == HWPCDepthLevel.CORE:
+            return [(report.sensor, socket_id, core_id)
+                    for socket_id, core_ids in zip(non_shared_group.sockets, non_shared_group.cores)
+                    for core_id in core_ids if core_id is not None]
+
+        return []
+
+
+def _groups_shape(report):
+    """
+    Compute a signature of the groups shape of the given report. Two reports with the same signature have the same
+    groups, sockets and cores
+
+    :rtype: tuple
+    """
+    return tuple((group_name, tuple(group), tuple(map(tuple, group.values()))) for group_name, group in report.groups.items())
+
 
 def _number_of_core_per_socket(group):
     """
@@ -98,7 +154,7 @@ def _number_of_core_per_socket(group):
     :type group: Dict
     :rtype: int : the number of core per socket in this group
     """
-    return len(list(group.values())[0])
+    return len(next(iter(group.values())))
 
 
 def _extract_non_shared_group(report):
@@ -117,3 +173,13 @@ def _extract_non_shared_group(report):
             maximum_number_of_core = number_of_core
             biggest_group = group
     return biggest_group
+
+
+def _extract_non_shared_columnar_group(report):
+    """
+    extract a non shared group form the columnar groups of the given report.
+    See :func:`_extract_non_shared_group`
+
+    :rtype: HWPCColumnarGroup: the columnar group with the highest number of core per socket
+    """
+    return max(report.columnar_groups.values(), key=lambda group: group.values.shape[1], default=None)
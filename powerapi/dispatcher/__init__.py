@@ -28,3 +28,4 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from powerapi.dispatcher.route_table import RouteTable
 from powerapi.dispatcher.dispatcher_actor import DispatcherActor
+from powerapi.dispatcher.sharded_dispatcher_actor import ShardedDispatcherActor
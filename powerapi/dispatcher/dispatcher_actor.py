@@ -26,18 +26,20 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from typing import Type, Tuple, List
+import zlib
+from typing import Type, Tuple, List, Optional
 
 from thespian.actors import ActorAddress, ActorExitRequest, ChildActorExited, PoisonMessage
 
 from powerapi.actor import Actor, InitializationException
-from powerapi.formula import FormulaActor, FormulaValues
+from powerapi.formula import FormulaActor, FormulaValues, FormulaHostActor
 from powerapi.dispatch_rule import DispatchRule
 from powerapi.utils import Tree
 from powerapi.report import Report
-from powerapi.message import StartMessage, DispatcherStartMessage, FormulaStartMessage, EndMessage, ErrorMessage, OKMessage
+from powerapi.message import StartMessage, DispatcherStartMessage, FormulaStartMessage, EndMessage, ErrorMessage, OKMessage, \
+    ReportBatch, FormulaHostStartMessage, HostedFormulaMessage, FormulaExitedMessage
 from powerapi.dispatcher.blocking_detector import BlockingDetector
-from powerapi.dispatcher.route_table import RouteTable
+from powerapi.dispatcher.route_table import RouteTable, common_prefix_length
 
 
 def _clean_list(id_list):
@@ -54,7 +56,28 @@ def _clean_list(id_list):
     return r_list
 
 
-def _extract_formula_id(report: Report, dispatch_rule: DispatchRule, primary_dispatch_rule: DispatchRule) -> List[Tuple]:
+def _address_key(address: ActorAddress):
+    """
+    ActorAddress are not hashable, return a value that identify the given address and that can be used as dictionary key
+    """
+    key = address.addressDetails
+    try:
+        hash(key)
+    except TypeError:
+        return str(address)
+    return key
+
+
+def get_shard_index(formula_id: Tuple, shard_number: int) -> int:
+    """
+    :return: index of the dispatcher shard that handles the formula with the given id. The index doesn't depend on the
+             process hash seed, so all the shards and their router compute the same value
+    """
+    return zlib.crc32(repr(formula_id).encode()) % shard_number
+
+
+def _extract_formula_id(report: Report, dispatch_rule: DispatchRule, primary_dispatch_rule: DispatchRule,
+                        prefix_length: Optional[int] = None) -> List[Tuple]:
     """
     Use the dispatch rule to extract formula_id from the given report.
     Formula id are then mapped to an identifier that match the primary
@@ -67,6 +90,8 @@ def _extract_formula_id(report: Report, dispatch_rule: DispatchRule, primary_dis
 
     :param powerapi.Report report:                 Report to split
     :param powerapi.DispatchRule dispatch_rule: DispatchRule rule
+    :param prefix_length:                       number of fields of the dispatch rule that match the primary dispatch
+                                                rule fields, computed from the rules if not given
 
     :return: List of formula_id associated to a sub-report of report
     :rtype: [tuple]
@@ -77,29 +102,10 @@ def _extract_formula_id(report: Report, dispatch_rule: DispatchRule, primary_dis
     if dispatch_rule.is_primary:
         return id_list
 
-    def f(formula_id):
-        return _match_report_id(formula_id, dispatch_rule, primary_dispatch_rule)
-
-    return _clean_list(list(map(f, id_list)))
+    if prefix_length is None:
+        prefix_length = common_prefix_length(dispatch_rule, primary_dispatch_rule)
 
-
-def _match_report_id(report_id: Tuple, dispatch_rule: DispatchRule, primary_rule: DispatchRule) -> Tuple:
-    """
-    Return the new_report_id with the report_id by removing
-    every "useless" fields from it.
-
-    :param tuple report_id:                     Original report id
-    :param powerapi.DispatchRule dispatch_rule: DispatchRule rule
-    """
-    new_report_id = ()
-    for i in range(len(report_id)):
-        if i >= len(primary_rule.fields):
-            return new_report_id
-        if dispatch_rule.fields[i] == primary_rule.fields[i]:
-            new_report_id += (report_id[i], )
-        else:
-            return new_report_id
-    return new_report_id
+    return _clean_list([formula_id[:prefix_length] for formula_id in id_list])
 
 
 class DispatcherActor(Actor):
@@ -117,11 +123,17 @@ class DispatcherActor(Actor):
         self.formula_values: FormulaValues = None
         self.route_table: RouteTable = None
         self.device_id = None
+        self.report_projection = False
+        self.shard_number = 1
+        self.shard_index = 0
+        self.formula_hosts = []
+        self.formula_host_names = []
 
         self._exit_mode = False
         self.formula_name_service = None
         self.formula_waiting_service = FormulaWaitingService()
         self.formula_pool = {}
+        self.formula_pool_names = {}
         self.formula_number_id = 0
 
     def _initialization(self, message: StartMessage):
@@ -130,12 +142,22 @@ class DispatcherActor(Actor):
         self.formula_values = message.formula_values
         self.route_table = message.route_table
         self.device_id = message.device_id
+        self.report_projection = message.report_projection
+        self.shard_number = message.shard_number
+        self.shard_index = message.shard_index
 
         self.formula_name_service = FormulaNameService()
 
         if self.route_table.primary_dispatch_rule is None:
             raise InitializationException('Dispatcher initialized without primary dispatch rule')
 
+        for host_index in range(message.formula_host_number):
+            host_name = self.name + '__host' + str(host_index)
+            host = self.createActor(FormulaHostActor)
+            self.send(host, FormulaHostStartMessage(self.name, host_name, self.formula_class))
+            self.formula_hosts.append(host)
+            self.formula_host_names.append(host_name)
+
     def receiveMsg_PoisonMessage(self, message: PoisonMessage, sender: ActorAddress):
         """
         When receiving a PoisonMessage from a formula :
@@ -144,24 +166,33 @@ class DispatcherActor(Actor):
             - if the formula crashed, restart it
         """
         poison_message = message.poisonMessage
-        for formula_name, (formula, blocking_detector) in self.formula_pool.items():
-            if sender == formula:
-                log_line = 'received poison messsage from formula ' + formula_name + ' for message ' + str(poison_message)
-                log_line += 'with this error stack : ' + message.details
-                self.log_debug(log_line)
-                blocking_detector.notify_poison_received(poison_message)
-                if blocking_detector.is_blocked():
-                    self.log_debug('formula ' + formula_name + ' is blocked : ' + str(blocking_detector.is_blocked()))
-                    self.log_debug('restart formula ' + formula_name)
-                    self.log_error('formula ' + formula_name + ' is blocked after this error : ' + message.details)
-                    self._restart_formula(formula_name)
-                    return
+        if isinstance(poison_message, HostedFormulaMessage):
+            formula_name = poison_message.formula_name
+            poison_message = poison_message.message
+        else:
+            formula_name = self._get_pool_formula_name(sender)
+        if formula_name not in self.formula_pool:
+            return
+        _, blocking_detector = self.formula_pool[formula_name]
+        log_line = 'received poison messsage from formula ' + formula_name + ' for message ' + str(poison_message)
+        log_line += 'with this error stack : ' + message.details
+        self.log_debug(log_line)
+        blocking_detector.notify_poison_received(poison_message)
+        if blocking_detector.is_blocked():
+            self.log_debug('formula ' + formula_name + ' is blocked : ' + str(blocking_detector.is_blocked()))
+            self.log_debug('restart formula ' + formula_name)
+            self.log_error('formula ' + formula_name + ' is blocked after this error : ' + message.details)
+            self._restart_formula(formula_name)
 
     def receiveMsg_ActorExitRequest(self, message: ActorExitRequest, sender: ActorAddress):
         """
         When receiving ActorExitRequest, forward it to all formula
         """
         Actor.receiveMsg_ActorExitRequest(self, message, sender)
+        if self.formula_hosts:
+            for host in self.formula_hosts:
+                self.send(host, ActorExitRequest())
+            return
         for _, (formula, __) in self.formula_pool.items():
             self.send(formula, ActorExitRequest())
         for _, formula in self.formula_waiting_service.get_all_formula():
@@ -169,6 +200,8 @@ class DispatcherActor(Actor):
 
     def _gen_formula_name(self, formula_id):
         name = 'formula' + str(self.formula_number_id)
+        if self.shard_number > 1:
+            name = 'shard' + str(self.shard_index) + '_' + name
         self.formula_number_id += 1
         for field in formula_id:
             name += '__' + str(field)
@@ -179,44 +212,111 @@ class DispatcherActor(Actor):
             formula, blocking_detector = self.formula_pool[formula_name]
             message.dispatcher_report_id = blocking_detector.get_message_id()
             self.log_debug('send ' + str(message) + ' to ' + formula_name)
-            self.send(formula, message)
+            self._send_to_formula(formula, formula_name, message)
         except KeyError:
             self.formula_waiting_service.add_message(formula_name, message)
 
+    def _send_to_formula(self, formula: ActorAddress, formula_name: str, message):
+        """
+        send a message to a formula, through its host if formulas are run by formula hosts
+        """
+        if self.formula_hosts:
+            message = HostedFormulaMessage(self.name, formula_name, message)
+        self.send(formula, message)
+
     def receiveMsg_Report(self, message: Report, _: ActorAddress):
         """
         When receiving a report, split it into sub-reports (if needed) and send them to their corresponding formula.
         If the corresponding formula does not exist, the dispatcher create it and send it the report
         """
         self.log_debug('received ' + str(message))
-        dispatch_rule = self.route_table.get_dispatch_rule(message)
+        for formula_name in self._get_formula_names(message):
+            self._send_message(formula_name, self._project(message, formula_name))
+
+    def receiveMsg_ReportBatch(self, message: ReportBatch, _: ActorAddress):
+        """
+        When receiving a batch of reports, split it into one sub-batch per formula and send each sub-batch to its
+        formula with one message. Reports for formulas that are not started yet are stored in the waiting service
+        """
+        self.log_debug('received ' + str(message))
+        formula_batches = {}
+        for report in message.reports:
+            for formula_name in self._get_formula_names(report):
+                if formula_name not in formula_batches:
+                    formula_batches[formula_name] = []
+                formula_batches[formula_name].append(self._project(report, formula_name))
+
+        for formula_name, reports in formula_batches.items():
+            if formula_name in self.formula_pool:
+                self._send_message(formula_name, ReportBatch(self.name, reports))
+            else:
+                for report in reports:
+                    self.formula_waiting_service.add_message(formula_name, report)
+
+    def _project(self, report: Report, formula_name: str) -> Report:
+        """
+        :return: the part of the report needed by the given formula if report projection is enabled and the report is
+                 dispatched with the primary dispatch rule, the report itself otherwise
+        """
+        if not self.report_projection:
+            return report
+        dispatch_rule = self.route_table.get_dispatch_rule(report)
+        if not dispatch_rule.is_primary:
+            return report
+        return dispatch_rule.project(report, self.formula_name_service.get_formula_id(formula_name))
+
+    def _get_formula_names(self, report: Report) -> List[str]:
+        """
+        :return: names of the formulas that must receive the given report. Formulas that don't exist yet are created
+        """
+        dispatch_rule = self.route_table.get_dispatch_rule(report)
         primary_dispatch_rule = self.route_table.primary_dispatch_rule
         if dispatch_rule is None:
-            self.log_warning('no dispatch rule for report ' + str(message))
-            return
-        formula_ids = _extract_formula_id(message, dispatch_rule, primary_dispatch_rule)
+            self.log_warning('no dispatch rule for report ' + str(report))
+            return []
+        prefix_length = None if dispatch_rule.is_primary else self.route_table.get_primary_prefix_length(dispatch_rule)
+        formula_ids = _extract_formula_id(report, dispatch_rule, primary_dispatch_rule, prefix_length)
 
+        formula_names = []
         for formula_id in formula_ids:
             primary_rule_fields = primary_dispatch_rule.fields
             if len(formula_id) == len(primary_rule_fields):
+                if self.shard_number > 1 and get_shard_index(formula_id, self.shard_number) != self.shard_index:
+                    continue
                 try:
-                    formula_name = self.formula_name_service.get_direct_formula_name(formula_id)
-                    self._send_message(formula_name, message)
+                    formula_names.append(self.formula_name_service.get_direct_formula_name(formula_id))
                 except KeyError:
                     formula_name = self._gen_formula_name(formula_id)
                     self.log_info('create formula ' + formula_name)
                     formula = self._create_formula(formula_id, formula_name)
                     self.formula_name_service.add(formula_id, formula_name)
                     self.formula_waiting_service.add(formula_name, formula)
-                    self.formula_waiting_service.add_message(formula_name, message)
+                    formula_names.append(formula_name)
             else:
-                for formula_name in self.formula_name_service.get_corresponding_formula(list(formula_id)):
-                    self._send_message(formula_name, message)
+                formula_names += self.formula_name_service.get_corresponding_formula(list(formula_id))
+        return formula_names
+
+    def _add_to_pool(self, formula_name: str, formula_address: ActorAddress):
+        self.formula_pool[formula_name] = (formula_address, BlockingDetector())
+        if not self.formula_hosts:
+            self.formula_pool_names[_address_key(formula_address)] = formula_name
+
+    def _remove_from_pool(self, formula_name: str):
+        formula_address, _ = self.formula_pool.pop(formula_name)
+        key = _address_key(formula_address)
+        if self.formula_pool_names.get(key) == formula_name:
+            del self.formula_pool_names[key]
+
+    def _get_pool_formula_name(self, formula_address: ActorAddress):
+        """
+        :return: name of the started formula with the given address or None if there is no such formula
+        """
+        return self.formula_pool_names.get(_address_key(formula_address))
 
     def _get_formula_name_from_address(self, formula_address: ActorAddress):
-        for name, (address, _) in self.formula_pool.items():
-            if formula_address == address:
-                return name
+        formula_name = self._get_pool_formula_name(formula_address)
+        if formula_name is not None:
+            return formula_name
         return self.formula_waiting_service.get_formula_by_address(formula_address)
 
     def receiveMsg_ChildActorExited(self, message: ChildActorExited, _: ActorAddress):
@@ -224,16 +324,37 @@ class DispatcherActor(Actor):
         When receive ChildActorExited from a formula:
         remove formula from formula pool and if dispatcher is in exit_mode and no formula is running, send an EndMessage to all pusher
         """
+        if self.formula_hosts:
+            return
         try:
             formula_name = self._get_formula_name_from_address(message.childAddress)
         except AttributeError:
             return
+        self._remove_exited_formula(formula_name)
+
+    def receiveMsg_FormulaExitedMessage(self, message: FormulaExitedMessage, _: ActorAddress):
+        """
+        When receiving FormulaExitedMessage from a formula host, remove the formula that exited as if its actor exited
+        """
+        if message.sender_name in self.formula_pool:
+            self._remove_exited_formula(message.sender_name)
+
+    def _remove_exited_formula(self, formula_name: str):
         self.formula_name_service.remove_formula(formula_name)
-        del self.formula_pool[formula_name]
+        self._remove_from_pool(formula_name)
         if self._exit_mode and not self.formula_pool:
+            self._end()
+
+    def _end(self):
+        """
+        send an EndMessage to the pushers, or to the router if the dispatcher is a shard, and stop the dispatcher
+        """
+        if self.shard_number > 1:
+            self.send(self.parent, EndMessage(self.name))
+        else:
             for _, pusher in self.formula_values.pushers.items():
                 self.send(pusher, EndMessage(self.name))
-            self.send(self.myAddress, ActorExitRequest())
+        self.send(self.myAddress, ActorExitRequest())
 
     def receiveMsg_ErrorMessage(self, message: ErrorMessage, _: ActorAddress):
         """
@@ -247,9 +368,12 @@ class DispatcherActor(Actor):
         When receiving OKMessage after trying to start a formula, move formula from the waiting service to the formula pool
         """
         formula_name = message.sender_name
+        if formula_name in self.formula_host_names:
+            self.log_debug('formula host ' + formula_name + ' started')
+            return
         waiting_messages = self.formula_waiting_service.get_waiting_messages(formula_name)
         self.formula_waiting_service.remove_formula(formula_name)
-        self.formula_pool[formula_name] = (sender, BlockingDetector())
+        self._add_to_pool(formula_name, sender)
         for waiting_msg in waiting_messages:
             self._send_message(formula_name, waiting_msg)
         self.log_info('formula ' + formula_name + 'started')
@@ -257,11 +381,15 @@ class DispatcherActor(Actor):
     def receiveMsg_EndMessage(self, message: EndMessage, _: ActorAddress):
         """
         When receiving an EndMessage, set dispatcher into exit_mode and send an EndMessage to all formula
+        A shard without formula ends immediately, as its router waits for all its shards to end
         """
         self.log_debug('received message ' + str(message))
         self._exit_mode = True
-        for _, (formula, __) in self.formula_pool.items():
-            self.send(formula, EndMessage(self.name))
+        if self.shard_number > 1 and not self.formula_pool and not self.formula_waiting_service.formulas:
+            self._end()
+            return
+        for formula_name, (formula, __) in self.formula_pool.items():
+            self._send_to_formula(formula, formula_name, EndMessage(self.name))
         for formula_name, _ in self.formula_waiting_service.get_all_formula():
             self.formula_waiting_service.add_message(formula_name, message)
 
@@ -271,8 +399,8 @@ class DispatcherActor(Actor):
 
         # remove crashed formula
         self.formula_name_service.remove_formula(formula_name)
-        del self.formula_pool[formula_name]
-        self.send(formula, ActorExitRequest())
+        self._remove_from_pool(formula_name)
+        self._send_to_formula(formula, formula_name, ActorExitRequest())
 
         # create new formula
         new_name = self._gen_formula_name(formula_id)
@@ -283,10 +411,17 @@ class DispatcherActor(Actor):
         self.log_debug('restart formula' + formula_name + ' with new name : ' + new_name)
 
     def _create_formula(self, formula_id: Tuple, formula_name: str) -> ActorAddress:
-        formula = self.createActor(self.formula_class)
+        """
+        create a formula actor, or a formula on one of the formula hosts, and send it its start message
+        :return: address of the formula actor or of the host that runs the formula
+        """
         domain_values = self.formula_class.gen_domain_values(self.device_id, formula_id)
         start_message = FormulaStartMessage(self.name, formula_name, self.formula_values, domain_values)
-        self.send(formula, start_message)
+        if self.formula_hosts:
+            formula = self.formula_hosts[self.formula_number_id % len(self.formula_hosts)]
+        else:
+            formula = self.createActor(self.formula_class)
+        self._send_to_formula(formula, formula_name, start_message)
         return formula
 
 
@@ -296,6 +431,7 @@ class FormulaWaitingService:
     """
     def __init__(self):
         self.formulas = {}
+        self.formula_names = {}
         self.waiting_messages = {}
 
     def get_all_formula(self) -> List[Tuple[str, ActorAddress]]:
@@ -309,6 +445,7 @@ class FormulaWaitingService:
         add a formula to the waiting service
         """
         self.formulas[formula_name] = formula_address
+        self.formula_names[_address_key(formula_address)] = formula_name
         self.waiting_messages[formula_name] = []
 
     def add_message(self, formula_name: str, message: Report):
@@ -331,9 +468,13 @@ class FormulaWaitingService:
         :return: the formula name bind to the given formula address
         :raise AttributeError: if no formula with the given address exists
         """
-        for name, address in self.formulas.items():
-            if formula_address == address:
-                return name
+        formula_name = self.formula_names.get(_address_key(formula_address))
+        if formula_name is not None:
+            return formula_name
+        # addresses returned by createActor are local addresses that are only equal to the final address of the formula
+        for formula_name, address in self.formulas.items():
+            if address == formula_address:
+                return formula_name
         raise AttributeError('no such formula with address ' + str(formula_address))
 
     def remove_formula(self, formula_name: str):
@@ -342,7 +483,9 @@ class FormulaWaitingService:
         :raise AttributeError: if no formula with the given name exists
         """
         if formula_name in self.formulas:
-            del self.formulas[formula_name]
+            key = _address_key(self.formulas.pop(formula_name))
+            if self.formula_names.get(key) == formula_name:
+                del self.formula_names[key]
             del self.waiting_messages[formula_name]
         else:
             raise AttributeError('unknow formula ' + str(formula_name))
@@ -354,6 +497,7 @@ class FormulaNameService:
     """
     def __init__(self):
         self.formula_name = {}
+        self.formula_id = {}
         self.formula_tree = Tree()
 
     def add(self, formula_id, formula_name: str):
@@ -361,6 +505,7 @@ class FormulaNameService:
         add a formula name into the service with its main id
         """
         self.formula_name[formula_id] = formula_name
+        self.formula_id[formula_name] = formula_id
         self.formula_tree.add(list(formula_id), formula_name)
 
     def get_direct_formula_name(self, formula_id) -> str:
@@ -378,10 +523,7 @@ class FormulaNameService:
         """
         return main formula id from formula name
         """
-        for formula_id, formula_name in self.formula_name.items():
-            if formula_name == formula_name_to_find:
-                return formula_id
-        return None
+        return self.formula_id.get(formula_name_to_find)
 
     def get_corresponding_formula(self, formula_id):
         """
@@ -395,15 +537,12 @@ class FormulaNameService:
 
     def remove_formula(self, formula_name_to_remove: str):
         """
-        remove from the pool the formula with the given address
-        :param formula_address_to_remove: address of the formula to remove
-        :raise AttributeError: if the pool doesn't contain any formula with this address
+        remove from the service the formula with the given name
+        :param formula_name_to_remove: name of the formula to remove
+        :raise AttributeError: if the service doesn't contain any formula with this name
         """
-        formula_id_to_remove = None
-        for formula_id, formula_name in self.formula_name.items():
-            if formula_name_to_remove == formula_name:
-                formula_id_to_remove = formula_id
-        if formula_id_to_remove is not None:
-            del self.formula_name[formula_id_to_remove]
-        else:
+        if formula_name_to_remove not in self.formula_id:
             raise AttributeError
+        formula_id = self.formula_id.pop(formula_name_to_remove)
+        del self.formula_name[formula_id]
+        self.formula_tree.remove(list(formula_id))
@@ -35,6 +35,19 @@ class PrimaryDispatchRuleRuleAlreadyDefinedException(PowerAPIException):
     """
 
 
+def common_prefix_length(dispatch_rule, primary_dispatch_rule) -> int:
+    """
+    :return: number of fields at the beginning of the dispatch rule identifier that are the same than the primary
+             dispatch rule fields
+    """
+    length = 0
+    for field, primary_field in zip(dispatch_rule.fields, primary_dispatch_rule.fields):
+        if field != primary_field:
+            break
+        length += 1
+    return length
+
+
 class RouteTable:
     """
     Structure that map a :class:`Report<powerapi.report.Report>` type to a
@@ -48,6 +61,9 @@ class RouteTable:
         #: (powerapi.DispatchRule): Allow to define how to create the Formula id
         self.primary_dispatch_rule = None
 
+        self._dispatch_rule_cache = {}
+        self._prefix_length_cache = {}
+
     def get_dispatch_rule(self, msg):
         """
         Return the corresponding group by rule mapped to the received message
@@ -59,12 +75,35 @@ class RouteTable:
         :raise: UnknowMessageTypeException if no group by rule is mapped to the
                 received message type
         """
+        msg_type = type(msg)
+        try:
+            return self._dispatch_rule_cache[msg_type]
+        except KeyError:
+            dispatch_rule = self._resolve_dispatch_rule(msg_type)
+            self._dispatch_rule_cache[msg_type] = dispatch_rule
+            return dispatch_rule
+
+    def _resolve_dispatch_rule(self, msg_type):
         for (report_class, dispatch_rule) in self.route_table:
-            if isinstance(msg, report_class):
+            if issubclass(msg_type, report_class):
                 return dispatch_rule
-
         return None
 
+    def get_primary_prefix_length(self, dispatch_rule) -> int:
+        """
+        Return the number of fields of the given dispatch rule identifiers that match the primary dispatch rule
+        identifiers. The value is computed once for each dispatch rule
+
+        :param dispatch_rule: dispatch rule of the route table
+        :type dispatch_rule: powerapi.dispatch_rule.DispatchRule
+        """
+        try:
+            return self._prefix_length_cache[dispatch_rule]
+        except KeyError:
+            length = common_prefix_length(dispatch_rule, self.primary_dispatch_rule)
+            self._prefix_length_cache[dispatch_rule] = length
+            return length
+
     def dispatch_rule(self, report_class, dispatch_rule):
         """
         Add a dispatch_rule rule to the route table
@@ -80,3 +119,5 @@ class RouteTable:
             self.primary_dispatch_rule = dispatch_rule
 
         self.route_table.append((report_class, dispatch_rule))
+        self._dispatch_rule_cache.clear()
+        self._prefix_length_cache.clear()
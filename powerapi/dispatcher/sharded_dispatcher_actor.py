@@ -0,0 +1,143 @@
+# Copyright (c) 2022, INRIA
+# Copyright (c) 2022, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import Iterable
+
+from thespian.actors import ActorAddress, ActorExitRequest, ChildActorExited
+
+from powerapi.actor import Actor
+from powerapi.report import Report
+from powerapi.message import DispatcherStartMessage, EndMessage, OKMessage, ReportBatch
+from powerapi.dispatcher.dispatcher_actor import DispatcherActor, get_shard_index, _extract_formula_id
+
+
+class ShardedDispatcherActor(Actor):
+    """
+    Dispatcher that shares the formulas between several DispatcherActor (shards).
+
+    Each formula is bound to one shard by hashing its primary dispatch rule id. Reports dispatched with the primary
+    dispatch rule are sent to the shards that handle their formulas, other reports are sent to every shard.
+    When all the shards ended, the dispatcher send an EndMessage to the pushers.
+    """
+
+    def __init__(self):
+        Actor.__init__(self, DispatcherStartMessage)
+
+        self.route_table = None
+        self.formula_values = None
+        self.shards = []
+        self.shard_names = []
+        self.ended_shards = set()
+
+    def _initialization(self, message: DispatcherStartMessage):
+        Actor._initialization(self, message)
+        self.route_table = message.route_table
+        self.formula_values = message.formula_values
+
+        for shard_index in range(message.shard_number):
+            shard_name = self.name + '__shard' + str(shard_index)
+            shard = self.createActor(DispatcherActor)
+            self.send(shard, DispatcherStartMessage(self.name, shard_name, message.formula_class, message.formula_values,
+                                                    message.route_table, message.device_id,
+                                                    report_projection=message.report_projection,
+                                                    shard_number=message.shard_number, shard_index=shard_index,
+                                                    formula_host_number=message.formula_host_number))
+            self.shards.append(shard)
+            self.shard_names.append(shard_name)
+
+    def _get_shards(self, report: Report) -> Iterable[int]:
+        """
+        :return: indexes of the shards that must receive the given report
+        """
+        dispatch_rule = self.route_table.get_dispatch_rule(report)
+        if dispatch_rule is None or not dispatch_rule.is_primary:
+            return range(len(self.shards))
+        formula_ids = _extract_formula_id(report, dispatch_rule, self.route_table.primary_dispatch_rule)
+        return {get_shard_index(formula_id, len(self.shards)) for formula_id in formula_ids}
+
+    def receiveMsg_Report(self, message: Report, _: ActorAddress):
+        """
+        When receiving a report, send it to the shards that handle its formulas
+        """
+        self.log_debug('received ' + str(message))
+        for shard_index in self._get_shards(message):
+            self.send(self.shards[shard_index], message)
+
+    def receiveMsg_ReportBatch(self, message: ReportBatch, _: ActorAddress):
+        """
+        When receiving a batch of reports, split it into one sub-batch per shard
+        """
+        self.log_debug('received ' + str(message))
+        shard_batches = {}
+        for report in message.reports:
+            for shard_index in self._get_shards(report):
+                if shard_index not in shard_batches:
+                    shard_batches[shard_index] = []
+                shard_batches[shard_index].append(report)
+
+        for shard_index, reports in shard_batches.items():
+            self.send(self.shards[shard_index], ReportBatch(self.name, reports))
+
+    def receiveMsg_OKMessage(self, message: OKMessage, _: ActorAddress):
+        """
+        When receiving an OKMessage from a shard, log that the shard started
+        """
+        self.log_debug('shard ' + message.sender_name + ' started')
+
+    def receiveMsg_EndMessage(self, message: EndMessage, _: ActorAddress):
+        """
+        When receiving an EndMessage from a shard, wait for the end of all the shards to send an EndMessage to the
+        pushers. Other EndMessage are forwarded to all the shards
+        """
+        self.log_debug('received message ' + str(message))
+        if message.sender_name not in self.shard_names:
+            for shard in self.shards:
+                self.send(shard, EndMessage(self.name))
+            return
+
+        self.ended_shards.add(message.sender_name)
+        if len(self.ended_shards) == len(self.shards):
+            for _, pusher in self.formula_values.pushers.items():
+                self.send(pusher, EndMessage(self.name))
+            self.send(self.myAddress, ActorExitRequest())
+
+    def receiveMsg_ActorExitRequest(self, message: ActorExitRequest, sender: ActorAddress):
+        """
+        When receiving ActorExitRequest, forward it to all shards
+        """
+        Actor.receiveMsg_ActorExitRequest(self, message, sender)
+        for shard in self.shards:
+            self.send(shard, ActorExitRequest())
+
+    def receiveMsg_ChildActorExited(self, message: ChildActorExited, _: ActorAddress):
+        """
+        When receiving ChildActorExited from a shard, log it
+        """
+        for shard_name, shard in zip(self.shard_names, self.shards):
+            if shard == message.childAddress:
+                self.log_debug('shard ' + shard_name + ' exited')
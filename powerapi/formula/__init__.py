@@ -28,3 +28,4 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from powerapi.formula.formula_actor import FormulaActor, FormulaValues, DomainValues
 from powerapi.formula.abstract_cpu_dram_formula import AbstractCpuDramFormula, CpuDramDomainValues
+from powerapi.formula.formula_host_actor import FormulaHostActor
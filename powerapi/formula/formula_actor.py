@@ -31,7 +31,7 @@ from typing import Dict, Type, Tuple
 from thespian.actors import ActorAddress, ActorExitRequest
 
 from powerapi.actor import Actor
-from powerapi.message import FormulaStartMessage, EndMessage
+from powerapi.message import FormulaStartMessage, EndMessage, ReportBatch
 
 
 class FormulaValues:
@@ -67,6 +67,15 @@ class FormulaActor(Actor):
         self.device_id = start_message.domain_values.device_id
         self.sensor = start_message.domain_values.sensor
 
+    def receiveMsg_ReportBatch(self, message: ReportBatch, sender: ActorAddress):
+        """
+        When receiving a batch of reports, handle each report as if it was received in its own message.
+        Formulas that can process a whole batch at once must override this method
+        """
+        self.log_debug('received message ' + str(message))
+        for report in message.reports:
+            self.receiveMessage(report, sender)
+
     def receiveMsg_EndMessage(self, message: EndMessage, _: ActorAddress):
         """
         when receiving a EndMessage kill itself
@@ -0,0 +1,148 @@
+# Copyright (c) 2022, INRIA
+# Copyright (c) 2022, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import Any, Dict
+
+from thespian.actors import ActorAddress, ActorExitRequest, WakeupMessage
+
+from powerapi.actor import Actor
+from powerapi.formula.formula_actor import FormulaActor
+from powerapi.message import FormulaHostStartMessage, FormulaStartMessage, HostedFormulaMessage, FormulaExitedMessage
+
+
+class _HostedFormulaRef:
+    """
+    Actor system reference given to a formula run by a FormulaHostActor. The formula uses the address and the mailbox
+    of its host, messages sent by the formula to itself are handled by the host
+    """
+    def __init__(self, host: 'FormulaHostActor', formula_name: str):
+        self.host = host
+        self.formula_name = formula_name
+
+    @property
+    def address(self) -> ActorAddress:
+        """
+        :return: address of the host
+        """
+        return self.host.myAddress
+
+    def actor_send(self, target_address: ActorAddress, message: Any):
+        """
+        send a message from the formula
+        """
+        if target_address == self.host.myAddress:
+            self.host.receive_from_formula(self.formula_name, message)
+        else:
+            self.host.send(target_address, message)
+
+    def wakeupAfter(self, time_period, payload=None):
+        """
+        ask the host to wake the formula after the given time period
+        """
+        self.host.wakeupAfter(time_period, (self.formula_name, payload))
+
+    def __getattr__(self, name):
+        return getattr(self.host._myRef, name)
+
+
+class FormulaHostActor(Actor):
+    """
+    Actor that runs several formulas of the same class.
+
+    Each formula is an instance of the formula class that doesn't have its own actor: messages are sent to the host
+    inside HostedFormulaMessage and the host delivers them to the formula with the given name. When a formula exits,
+    the host sends a FormulaExitedMessage to its parent
+    """
+
+    def __init__(self):
+        Actor.__init__(self, FormulaHostStartMessage)
+        self.formula_class = None
+        self.formulas: Dict[str, FormulaActor] = {}
+
+    def _initialization(self, message: FormulaHostStartMessage):
+        Actor._initialization(self, message)
+        self.formula_class = message.formula_class
+
+    def _create_formula(self, formula_name: str) -> FormulaActor:
+        formula = self.formula_class()
+        # the formula is not created by the actor system, give it an actor reference that use the host
+        formula._myRef = _HostedFormulaRef(self, formula_name)
+        self.formulas[formula_name] = formula
+        return formula
+
+    def receiveMsg_HostedFormulaMessage(self, message: HostedFormulaMessage, sender: ActorAddress):
+        """
+        When receiving a HostedFormulaMessage, deliver the message it contains to the formula. The formula is created if
+        the message is a FormulaStartMessage
+        """
+        if isinstance(message.message, FormulaStartMessage) and message.formula_name not in self.formulas:
+            self._create_formula(message.formula_name)
+
+        formula = self.formulas.get(message.formula_name)
+        if formula is None:
+            self.log_warning('received message for unknow formula ' + message.formula_name)
+            return
+
+        if isinstance(message.message, ActorExitRequest):
+            self._exit_formula(message.formula_name, message.message)
+        else:
+            formula.receiveMessage(message.message, sender)
+
+    def receive_from_formula(self, formula_name: str, message: Any):
+        """
+        handle a message sent by a formula to itself
+        """
+        if isinstance(message, ActorExitRequest):
+            self._exit_formula(formula_name, message)
+        else:
+            self.send(self.myAddress, HostedFormulaMessage(formula_name, formula_name, message))
+
+    def _exit_formula(self, formula_name: str, message: ActorExitRequest):
+        formula = self.formulas.pop(formula_name, None)
+        if formula is None:
+            return
+        formula.receiveMessage(message, self.myAddress)
+        self.send(self.parent, FormulaExitedMessage(formula_name))
+
+    def receiveMsg_WakeupMessage(self, message: WakeupMessage, _: ActorAddress):
+        """
+        When receiving a WakeupMessage, deliver it to the formula that asked for it
+        """
+        formula_name, payload = message.payload
+        formula = self.formulas.get(formula_name)
+        if formula is not None:
+            formula.receiveMessage(WakeupMessage(message.delayPeriod, payload), self.myAddress)
+
+    def receiveMsg_ActorExitRequest(self, message: ActorExitRequest, sender: ActorAddress):
+        """
+        When receiving ActorExitRequest, forward it to all formulas
+        """
+        Actor.receiveMsg_ActorExitRequest(self, message, sender)
+        for formula in self.formulas.values():
+            formula.receiveMessage(message, self.myAddress)
+        self.formulas = {}
@@ -30,7 +30,7 @@
 from thespian.actors import ActorAddress
 
 from powerapi.formula import FormulaActor
-from powerapi.message import FormulaStartMessage
+from powerapi.message import FormulaStartMessage, ReportBatch
 from powerapi.report import Report
 
 
@@ -57,3 +57,13 @@ class SimpleFormulaActor(FormulaActor):
         for _, pusher in self.pushers.items():
             self.send(pusher, message)
             self.log_debug('sent message ' + str(message) + ' to ' + str(pusher))
+
+    def receiveMsg_ReportBatch(self, message: ReportBatch, _: ActorAddress):
+        """
+            When receiving a batch of reports send it to the destinations without splitting it
+        """
+        self.log_debug('received message ' + str(message))
+
+        for _, pusher in self.pushers.items():
+            self.send(pusher, message)
+            self.log_debug('sent message ' + str(message) + ' to ' + str(pusher))
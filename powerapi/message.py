@@ -36,6 +36,7 @@ if TYPE_CHECKING:
     from powerapi.dispatcher import RouteTable
     from powerapi.formula import FormulaActor, FormulaValues, DomainValues
     from powerapi.report_modifier import ReportModifier
+    from powerapi.report import Report
 
 
 class Message:
@@ -43,6 +44,8 @@ class Message:
     Abstract Message class
     """
 
+    __slots__ = ('sender_name',)
+
     def __init__(self, sender_name: str):
         self.sender_name = sender_name
 
@@ -115,13 +118,40 @@ class EndMessage(Message):
         return "EndMessage"
 
 
+class ReportBatch(Message):
+    """
+    Message used to send several reports to an actor in one message
+    """
+
+    def __init__(self, sender_name: str, reports: List[Report]):
+        """
+        :param sender_name: name of the actor that send the message
+        :param reports: list of reports contained in the batch
+        """
+        Message.__init__(self, sender_name)
+        self.reports = reports
+
+        #: id given by the dispatcher actor in order manage report order
+        self.dispatcher_report_id = None
+
+    def __len__(self):
+        return len(self.reports)
+
+    def __iter__(self):
+        return iter(self.reports)
+
+    def __str__(self):
+        return 'ReportBatch(' + str(len(self.reports)) + ' reports)'
+
+
 class PullerStartMessage(StartMessage):
     """
     Message used to start a Puller actor
     """
 
     def __init__(self, sender_name: str, name: str, database: BaseDB, report_filter: Filter, stream_mode: bool,
-                 report_modifiers: List[ReportModifier] = []):
+                 report_modifiers: List[ReportModifier] = [], batch_size: int = 100, batch_time: float = 0.5,
+                 min_interval: float = 0.05, max_interval: float = 1.0, report_batch: bool = False):
         """
         :param sender_name: name of the actor that send the message
         :param name: puller actor name
@@ -129,12 +159,22 @@ class PullerStartMessage(StartMessage):
         :param report_filter: report filter used to filter reports
         :param stream_mode: True if stream mode is enabled
         :param report_modifier_list: list of ReportModifier used to modify report before sending them to dispatcher
+        :param batch_size: maximum number of reports pulled during one wakeup
+        :param batch_time: maximum time (in seconds) spent pulling reports during one wakeup
+        :param min_interval: time (in seconds) to wait between two wakeups when the database is not empty
+        :param max_interval: maximum time (in seconds) to wait between two wakeups when the database is empty
+        :param report_batch: True if the reports pulled during one wakeup are sent to dispatchers as ReportBatch
         """
         StartMessage.__init__(self, sender_name, name)
         self.database = database
         self.report_filter = report_filter
         self.stream_mode = stream_mode
         self.report_modifier_list = report_modifiers
+        self.batch_size = batch_size
+        self.batch_time = batch_time
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.report_batch = report_batch
 
 
 class SimplePullerStartMessage(StartMessage):
@@ -163,7 +203,8 @@ class DispatcherStartMessage(StartMessage):
     """
 
     def __init__(self, sender_name: str, name: str, formula_class: Type[FormulaActor], formula_values: FormulaValues,
-                 route_table: RouteTable, device_id: str):
+                 route_table: RouteTable, device_id: str, report_projection: bool = False, shard_number: int = 1,
+                 shard_index: int = 0, formula_host_number: int = 0):
         """
         :param sender_name: name of the actor that send the message
         :param name: puller actor name
@@ -171,12 +212,23 @@ class DispatcherStartMessage(StartMessage):
         :param formula_values: Values that will be always passed to formula for initialization
         :param route_table: Dispatcher's Route table
         :param device_id: name of the device the dispatcher handle
+        :param report_projection: if True, reports dispatched with the primary dispatch rule are restricted to the part
+                                  of the report that match the id of the formula that receive them
+        :param shard_number: number of dispatchers that share the formulas (see ShardedDispatcherActor)
+        :param shard_index: index of the dispatcher among the shards, the dispatcher only handles the formulas whose id
+                            is bound to this index
+        :param formula_host_number: number of FormulaHostActor that run the formulas of the dispatcher, if 0 each
+                                    formula runs in its own actor
         """
         StartMessage.__init__(self, sender_name, name)
         self.formula_class = formula_class
         self.formula_values = formula_values
         self.route_table = route_table
         self.device_id = device_id
+        self.report_projection = report_projection
+        self.shard_number = shard_number
+        self.shard_index = shard_index
+        self.formula_host_number = formula_host_number
 
 
 class FormulaStartMessage(StartMessage):
@@ -196,6 +248,55 @@ class FormulaStartMessage(StartMessage):
         self.domain_values = domain_values
 
 
+class FormulaHostStartMessage(StartMessage):
+    """
+    Message used to start a FormulaHost actor
+    """
+
+    def __init__(self, sender_name: str, name: str, formula_class: Type[FormulaActor]):
+        """
+        :param sender_name: name of the actor that send the message
+        :param name: formula host actor name
+        :param formula_class: Class of the formulas run by the host
+        """
+        StartMessage.__init__(self, sender_name, name)
+        self.formula_class = formula_class
+
+
+class HostedFormulaMessage(Message):
+    """
+    Message sent to a FormulaHost actor to deliver a message to one of the formulas it runs
+    """
+
+    def __init__(self, sender_name: str, formula_name: str, message):
+        """
+        :param sender_name: name of the actor that send the message
+        :param formula_name: name of the formula that must receive the message
+        :param message: message to deliver to the formula
+        """
+        Message.__init__(self, sender_name)
+        self.formula_name = formula_name
+        self.message = message
+
+    def __str__(self):
+        return 'HostedFormulaMessage(' + self.formula_name + ', ' + str(self.message) + ')'
+
+
+class FormulaExitedMessage(Message):
+    """
+    Message sent by a FormulaHost actor to its parent when one of the formulas it runs exits
+    """
+
+    def __init__(self, sender_name: str):
+        """
+        :param sender_name: name of the formula that exited
+        """
+        Message.__init__(self, sender_name)
+
+    def __str__(self):
+        return 'FormulaExitedMessage'
+
+
 class PusherStartMessage(StartMessage):
     """
     Message used to start a Pusher actor
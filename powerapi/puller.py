@@ -27,15 +27,29 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import logging
-import asyncio
+import time
+from datetime import timedelta
+from typing import Dict
 
-from thespian.actors import ActorExitRequest
+from thespian.actors import ActorExitRequest, ActorAddress
 
 from powerapi.actor import TimedActor, InitializationException
 from powerapi.report import BadInputData
-from powerapi.database import DBError
-from powerapi.message import PullerStartMessage, EndMessage
+from powerapi.database import DBError, AsyncDBReader
+from powerapi.message import PullerStartMessage, EndMessage, ReportBatch
+
+PULL_RATE_LOG_PERIOD = 10
+
+
+def _add_to_batch(batches, dispatcher, report):
+    """
+    add a report to the batch of the given dispatcher (ActorAddress are not hashable)
+    """
+    for batch_dispatcher, reports in batches:
+        if batch_dispatcher == dispatcher:
+            reports.append(report)
+            return
+    batches.append((dispatcher, [report]))
 
 
 class PullerActor(TimedActor):
@@ -43,6 +57,10 @@ class PullerActor(TimedActor):
     Actor used to pull data from sources.
 
     A puller Actor is configured to pull data from one type of sources
+
+    At each wakeup, the puller drains its source until it pulled `batch_size` reports or spent `batch_time` seconds.
+    While the source has backlog, the puller is woken up again immediately. When the source is empty, the time to
+    wait before the next wakeup is doubled at each try, from `min_interval` up to `max_interval`
     """
     def __init__(self):
         TimedActor.__init__(self, PullerStartMessage, 0.05)
@@ -52,9 +70,16 @@ class PullerActor(TimedActor):
         self.stream_mode = None
         self.database_it = None
         self.report_modifier_list = None
-        self.loop = None
 
-        self._number_of_message_before_sleeping = 10
+        self.batch_size = None
+        self.batch_time = None
+        self.min_interval = None
+        self.max_interval = None
+        self.report_batch = None
+        self._current_interval = None
+
+        self._pulled_report_count = 0
+        self._rate_period_start = None
 
     def _initialization(self, start_message: PullerStartMessage):
         TimedActor._initialization(self, start_message)
@@ -64,6 +89,17 @@ class PullerActor(TimedActor):
         self.stream_mode = start_message.stream_mode
         self.report_modifier_list = start_message.report_modifier_list
 
+        self.batch_size = start_message.batch_size
+        self.batch_time = start_message.batch_time
+        self.min_interval = start_message.min_interval
+        self.max_interval = start_message.max_interval
+        self.report_batch = start_message.report_batch
+        self._current_interval = self.min_interval
+        self._time_interval = timedelta(seconds=self.min_interval)
+        self._rate_period_start = time.monotonic()
+        if self.batch_size <= 0 or self.min_interval <= 0 or self.max_interval < self.min_interval:
+            raise InitializationException('invalid pull batch configuration')
+
         self._database_connection()
         if not self.report_filter.filters:
             raise InitializationException('filter without rules')
@@ -72,13 +108,10 @@ class PullerActor(TimedActor):
         try:
             if not self.database.asynchrone:
                 self.database.connect()
+                self.database_it = self.database.iter(self.stream_mode)
             else:
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-                self.loop.set_debug(enabled=True)
-                logging.basicConfig(level=logging.DEBUG)
-                self.loop.run_until_complete(self.database.connect())
-            self.database_it = self.database.iter(self.stream_mode)
+                self.database_it = AsyncDBReader(self.database, self.stream_mode)
+                self.database_it.start()
         except DBError as error:
             raise InitializationException(error.msg) from error
 
@@ -89,30 +122,88 @@ class PullerActor(TimedActor):
 
     def _launch_task(self):
         """
-        Initialize the database and connect all dispatcher to the
-        socket_interface
+        Pull reports from the database and send them to the dispatchers until the batch budget is consumed or the
+        database is empty, then schedule the next wakeup
         """
-        for _ in range(self._number_of_message_before_sleeping):
+        pulled_reports = 0
+        batches = []
+        deadline = time.monotonic() + self.batch_time
+        while pulled_reports < self.batch_size and time.monotonic() < deadline:
             try:
                 raw_report = self._pull_database()
-                report = self._modify_report(raw_report)
-                dispatchers = self.report_filter.route(report)
-                for dispatcher in dispatchers:
-                    self.log_debug('send report ' + str(report) + 'to ' + str(dispatcher))
-                    self.send(dispatcher, report)
-                self.wakeupAfter(self._time_interval)
-                return
+                if raw_report is None:
+                    self._send_batches(batches)
+                    self._log_pull_rate(pulled_reports)
+                    self._schedule_next_wakeup(pulled_reports, source_empty=True)
+                    return
             except StopIteration:
-                if self.stream_mode:
-                    self.wakeupAfter(self._time_interval)
+                self._send_batches(batches)
+                if not self.stream_mode:
+                    self._log_pull_rate(pulled_reports, force=True)
+                    self.log_info('input source empty, stop system')
+                    self._terminate()
                     return
-                self.log_info('input source empty, stop system')
-                self._terminate()
+                self._log_pull_rate(pulled_reports)
+                self._schedule_next_wakeup(pulled_reports, source_empty=True)
                 return
             except BadInputData as exn:
                 log_line = 'BadinputData exception raised for input data' + str(exn.input_data)
                 log_line += ' with message : ' + exn.msg
                 self.log_warning(log_line)
+                continue
+
+            report = self._modify_report(raw_report)
+            dispatchers = self.report_filter.route(report)
+            for dispatcher in dispatchers:
+                if self.report_batch:
+                    _add_to_batch(batches, dispatcher, report)
+                else:
+                    self.log_debug('send report ' + str(report) + 'to ' + str(dispatcher))
+                    self.send(dispatcher, report)
+            pulled_reports += 1
+
+        self._send_batches(batches)
+        self._log_pull_rate(pulled_reports)
+        self._schedule_next_wakeup(pulled_reports, source_empty=False)
+
+    def _send_batches(self, batches):
+        for dispatcher, reports in batches:
+            batch = ReportBatch(self.name, reports)
+            self.log_debug('send ' + str(batch) + ' to ' + str(dispatcher))
+            self.send(dispatcher, batch)
+
+    def _schedule_next_wakeup(self, pulled_reports: int, source_empty: bool):
+        """
+        Re-arm the puller immediately if the batch budget was consumed, after min_interval if the source was drained
+        and with an exponential backoff (bounded by max_interval) if nothing was pulled
+        """
+        if not source_empty:
+            self._current_interval = self.min_interval
+            self.wakeupAfter(timedelta(0))
+            return
+
+        if pulled_reports > 0:
+            self._current_interval = self.min_interval
+        else:
+            self._current_interval = min(max(self._current_interval * 2, self.min_interval), self.max_interval)
+        self.wakeupAfter(timedelta(seconds=self._current_interval))
+
+    def _log_pull_rate(self, pulled_reports: int, force: bool = False):
+        self._pulled_report_count += pulled_reports
+        now = time.monotonic()
+        elapsed = now - self._rate_period_start
+        if not force and elapsed < PULL_RATE_LOG_PERIOD:
+            return
+        if elapsed > 0:
+            rate = self._pulled_report_count / elapsed
+            log_line = 'pulled ' + str(self._pulled_report_count) + ' reports in ' + '%.2f' % elapsed
+            log_line += 's (' + '%.1f' % rate + ' reports/s)'
+            stats = self.get_database_stats()
+            if stats:
+                log_line += ', input ' + ', '.join(name + ': ' + str(value) for name, value in stats.items())
+            self.log_info(log_line)
+        self._pulled_report_count = 0
+        self._rate_period_start = now
 
     def _terminate(self):
         self.send(self.parent, EndMessage(self.name))
@@ -120,13 +211,27 @@ class PullerActor(TimedActor):
             self.send(dispatcher, EndMessage(self.name))
         self.send(self.myAddress, ActorExitRequest())
 
+    def get_database_stats(self) -> Dict[str, int]:
+        """
+        :return: statistics of the input database (ex: enqueued, dropped reports and queue depth of socket inputs)
+        """
+        if self.database.asynchrone:
+            return self.database_it.get_stats()
+        return self.database.get_stats()
+
     def _pull_database(self):
+        """
+        :return: the next report of the database or None if no report is ready yet (asynchronous database)
+        :raise StopIteration: if the database is empty
+        """
         if self.database.asynchrone:
-            report = self.loop.run_until_complete(self.database_it.__anext__())
-            # print(report)
-            if report is not None:
-                return report
-            else:
-                raise StopIteration()
-        else:
-            return next(self.database_it)
+            return self.database_it.get()
+        return next(self.database_it)
+
+    def receiveMsg_ActorExitRequest(self, message: ActorExitRequest, sender: ActorAddress):
+        """
+        When receiving ActorExitRequest, stop the event loop thread of asynchronous database
+        """
+        TimedActor.receiveMsg_ActorExitRequest(self, message, sender)
+        if self.database is not None and self.database.asynchrone and self.database_it is not None:
+            self.database_it.stop()
@@ -29,9 +29,9 @@
 from thespian.actors import ActorAddress, ActorExitRequest
 
 from powerapi.actor import Actor, InitializationException
-from powerapi.message import PusherStartMessage, EndMessage
+from powerapi.message import PusherStartMessage, EndMessage, ReportBatch
 from powerapi.database import DBError
-from powerapi.report import PowerReport, BadInputData
+from powerapi.report import Report, PowerReport, BadInputData
 from powerapi.exception import PowerAPIExceptionWithMessage, PowerAPIException
 
 
@@ -60,19 +60,37 @@ class PusherActor(Actor):
         When receiving a PowerReport save it to database
         """
         self.log_debug('received message ' + str(message))
+        self._save(message)
+
+    def receiveMsg_ReportBatch(self, message: ReportBatch, _: ActorAddress):
+        """
+        When receiving a batch of reports save them to database with one call to save_many. If the batch can't be
+        saved, reports are saved one by one to isolate the bad ones
+        """
+        self.log_debug('received message ' + str(message))
+        try:
+            self.database.save_many(message.reports)
+            self.log_debug(str(message) + ' saved to database')
+        except PowerAPIException as exn:
+            self.log_debug('exception ' + str(exn) + ' was raised while trying to save ' + str(message) +
+                           ', save reports one by one')
+            for report in message.reports:
+                self._save(report)
+
+    def _save(self, report: Report):
         try:
-            self.database.save(message)
-            self.log_debug(str(message) + 'saved to database')
+            self.database.save(report)
+            self.log_debug(str(report) + 'saved to database')
         except BadInputData as exn:
             log_line = 'BadinputData exception raised for report' + str(exn.input_data)
             log_line += ' with message : ' + exn.msg
             self.log_warning(log_line)
         except PowerAPIExceptionWithMessage as exn:
-            log_line = 'exception ' + str(exn) + 'was raised while trying to save ' + str(message)
+            log_line = 'exception ' + str(exn) + 'was raised while trying to save ' + str(report)
             log_line += 'with message : ' + str(exn.msg)
             self.log_warning(log_line)
         except PowerAPIException as exn:
-            self.log_warning('exception ' + str(exn) + 'was raised while trying to save ' + str(message))
+            self.log_warning('exception ' + str(exn) + 'was raised while trying to save ' + str(report))
 
     def receiveMsg_EndMessage(self, message: EndMessage, _: ActorAddress):
         """
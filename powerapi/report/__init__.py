@@ -29,6 +29,6 @@
 
 from powerapi.report.report import Report, BadInputData
 from powerapi.report.power_report import PowerReport
-from powerapi.report.hwpc_report import HWPCReport
+from powerapi.report.hwpc_report import HWPCReport, HWPCColumnarGroup
 from powerapi.report.control_report import ControlReport
 from powerapi.report.procfs_report import ProcfsReport
@@ -40,6 +40,8 @@ class ControlReport(Report):
     This is useful to control external tools via a producer/consumer job queue.
     """
 
+    __slots__ = ('action', 'parameters')
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, action: str, parameters: List, metadata: Dict[str, Any] = {}):
         """
         Initialize a Control Event report using the given parameters.
@@ -76,4 +78,7 @@ class ControlReport(Report):
         """
         :return: a dictionary, that can be stored into a mongodb, from a given ControlReport
         """
-        return report.__dict__
+        json = Report.to_json(report)
+        json['action'] = report.action
+        json['parameters'] = report.parameters
+        return json
@@ -29,7 +29,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+import numpy as np
 
 from powerapi.report.report import Report, BadInputData, CSV_HEADER_COMMON, CsvLines
 
@@ -37,6 +39,140 @@ from powerapi.report.report import Report, BadInputData, CSV_HEADER_COMMON, CsvL
 CSV_HEADER_HWPC = CSV_HEADER_COMMON + ['socket', 'cpu']
 
 
+class HWPCColumnarGroup:
+    """
+    Columnar representation of a HWPC report group
+
+    Event values are stored in a dense int64 array indexed by (socket, core, event). Index tables give the socket id,
+    core id and event name of each position. Sockets that have fewer cores than the others are padded with None core ids
+    and zero values, events missing for a core are set to zero.
+    """
+
+    __slots__ = ('sockets', 'cores', 'events', 'values')
+
+    def __init__(self, sockets: List[str], cores: List[List[Optional[str]]], events: List[str], values: np.ndarray):
+        """
+        :param sockets: socket id of each socket index
+        :param cores: for each socket index, core id of each core index
+        :param events: event name of each event index
+        :param values: int64 array of shape (socket, core, event)
+        """
+        self.sockets = sockets
+        self.cores = cores
+        self.events = events
+        self.values = values
+
+    def __eq__(self, other):
+        return (isinstance(other, HWPCColumnarGroup) and
+                self.sockets == other.sockets and
+                self.cores == other.cores and
+                self.events == other.events and
+                np.array_equal(self.values, other.values))
+
+    def __repr__(self) -> str:
+        return 'HWPCColumnarGroup(%s, %s, %s)' % (self.sockets, self.events, self.values.shape)
+
+    def socket_index(self, socket_id: str) -> int:
+        """
+        :return: index of the given socket id in the values array
+        """
+        return self.sockets.index(socket_id)
+
+    def event_index(self, event_name: str) -> int:
+        """
+        :return: index of the given event name in the values array
+        """
+        return self.events.index(event_name)
+
+    def get_event(self, event_name: str) -> np.ndarray:
+        """
+        :return: (socket, core) array with the values of the given event
+        """
+        return self.values[:, :, self.event_index(event_name)]
+
+    def get_socket(self, socket_id: str) -> np.ndarray:
+        """
+        :return: (core, event) array with the values of the given socket
+        """
+        return self.values[self.socket_index(socket_id)]
+
+    @staticmethod
+    def from_dict(group: Dict[str, Dict[str, Dict[str, int]]]) -> HWPCColumnarGroup:
+        """
+        :param group: nested dictionary (socket -> core -> event -> value) of a HWPC report group
+        :return: the columnar representation of the given group
+        """
+        sockets = list(group.keys())
+        cores = [list(socket_group.keys()) for socket_group in group.values()]
+        core_groups = [core_group for socket_group in group.values() for core_group in socket_group.values()]
+        events = list(core_groups[0].keys()) if core_groups else []
+        core_number = max(map(len, cores), default=0)
+
+        if all(len(core_ids) == core_number for core_ids in cores) and \
+           all(list(core_group.keys()) == events for core_group in core_groups):
+            values = np.array([list(core_group.values()) for core_group in core_groups], dtype=np.int64)
+            values = values.reshape((len(sockets), core_number, len(events)))
+            return HWPCColumnarGroup(sockets, cores, events, values)
+
+        return HWPCColumnarGroup._from_irregular_dict(group, sockets, cores, core_number)
+
+    @staticmethod
+    def _from_irregular_dict(group, sockets, cores, core_number):
+        event_indexes = {}
+        for socket_group in group.values():
+            for core_group in socket_group.values():
+                for event_name in core_group:
+                    event_indexes.setdefault(event_name, len(event_indexes))
+
+        values = np.zeros((len(sockets), core_number, len(event_indexes)), dtype=np.int64)
+        for socket_index, socket_group in enumerate(group.values()):
+            for core_index, core_group in enumerate(socket_group.values()):
+                for event_name, value in core_group.items():
+                    values[socket_index, core_index, event_indexes[event_name]] = value
+
+        cores = [core_ids + [None] * (core_number - len(core_ids)) for core_ids in cores]
+        return HWPCColumnarGroup(sockets, cores, list(event_indexes), values)
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        :return: nested dictionary (socket -> core -> event -> value) of the group, padding cores are removed
+        """
+        rows = self.values.tolist()
+        group = {}
+        for socket_id, core_ids, socket_rows in zip(self.sockets, self.cores, rows):
+            group[socket_id] = {core_id: dict(zip(self.events, core_row))
+                                for core_id, core_row in zip(core_ids, socket_rows) if core_id is not None}
+        return group
+
+    @staticmethod
+    def from_json(data: Dict) -> HWPCColumnarGroup:
+        """
+        :param data: dictionary produced by the to_json method
+        :return: the columnar group initialized with the given data
+        """
+        try:
+            values = np.array(data['values'], dtype=np.int64)
+            values = values.reshape((len(data['sockets']), len(data['cores'][0]) if data['cores'] else 0, len(data['events'])))
+            return HWPCColumnarGroup(list(data['sockets']), [list(core_ids) for core_ids in data['cores']],
+                                     list(data['events']), values)
+        except KeyError as exn:
+            raise BadInputData('HWPC columnar group require field ' + str(exn.args[0]) + ' in json document', data) from exn
+        except ValueError as exn:
+            raise BadInputData(exn.args[0], data) from exn
+
+    @staticmethod
+    def to_json(group: HWPCColumnarGroup) -> Dict:
+        """
+        :return: a dictionary, that can be converted into json format, from a given columnar group
+        """
+        return {
+            'sockets': group.sockets,
+            'cores': group.cores,
+            'events': group.events,
+            'values': group.values.tolist()
+        }
+
+
 class HWPCReport(Report):
     """
     HWPCReport class
@@ -65,6 +201,8 @@ class HWPCReport(Report):
         }
     """
 
+    __slots__ = ('_groups', '_columnar_groups')
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, groups: Dict[str, Dict], metadata: Dict[str, Any] = {}):
         """
         Initialize an HWPC report using the given parameters.
@@ -75,8 +213,68 @@ class HWPCReport(Report):
         """
         Report.__init__(self, timestamp, sensor, target, metadata)
 
-        #: (dict): Events groups
-        self.groups = groups
+        self._groups = groups
+        self._columnar_groups = None
+
+    @property
+    def groups(self) -> Dict[str, Dict]:
+        """
+        :return: events groups as nested dictionaries (group -> socket -> core -> event -> value)
+        """
+        if self._groups is None:
+            self._groups = {name: group.to_dict() for name, group in self._columnar_groups.items()}
+        return self._groups
+
+    @groups.setter
+    def groups(self, groups: Dict[str, Dict]):
+        self._groups = groups
+        self._columnar_groups = None
+
+    @property
+    def columnar_groups(self) -> Dict[str, HWPCColumnarGroup]:
+        """
+        :return: events groups in their columnar representation, computed on first access
+        """
+        if self._columnar_groups is None:
+            self._columnar_groups = {name: HWPCColumnarGroup.from_dict(group) for name, group in self._groups.items()}
+        return self._columnar_groups
+
+    def has_columnar_groups(self) -> bool:
+        """
+        :return: True if the columnar representation of the groups is already available
+        """
+        return self._columnar_groups is not None
+
+    def get_sub_report(self, socket_id: str, core_id: str = None) -> HWPCReport:
+        """
+        Create a report that only contains the values of the given socket and core. Groups that don't contain the given
+        core keep all the cores of the socket and groups that don't contain the socket are removed
+
+        :param socket_id: id of the socket to keep
+        :param core_id: id of the core to keep, all cores are kept if None
+        """
+        groups = {}
+        for group_name, group in self.groups.items():
+            if socket_id not in group:
+                continue
+            socket_group = group[socket_id]
+            if core_id is not None and core_id in socket_group:
+                socket_group = {core_id: socket_group[core_id]}
+            groups[group_name] = {socket_id: socket_group}
+
+        timestamp = self._timestamp if self._timestamp is not None else self._timestamp_ms
+        return HWPCReport(timestamp, self.sensor, self.target, groups, self.metadata)
+
+    @staticmethod
+    def from_columnar_groups(timestamp: datetime, sensor: str, target: str, columnar_groups: Dict[str, HWPCColumnarGroup],
+                             metadata: Dict[str, Any] = {}) -> HWPCReport:
+        """
+        Create an HWPC report from groups in their columnar representation, nested dictionaries are only built if the
+        groups attribute is accessed
+        """
+        report = HWPCReport(timestamp, sensor, target, None, metadata)
+        report._columnar_groups = columnar_groups
+        return report
 
     def __repr__(self) -> str:
         return 'HWCPReport(%s, %s, %s, %s, %s)' % (self.timestamp, self.sensor, self.target, sorted(self.groups.keys()), str(self.metadata))
@@ -99,7 +297,12 @@ class HWPCReport(Report):
 
     @staticmethod
     def to_json(report: HWPCReport) -> Dict:
-        return report.__dict__
+        """
+        :return: a dictionary, that can be converted into json format, from a given HWPCReport
+        """
+        json = Report.to_json(report)
+        json['groups'] = report.groups
+        return json
 
     @staticmethod
     def from_mongodb(data: Dict) -> HWPCReport:
@@ -41,6 +41,8 @@ class PowerReport(Report):
     PowerReport stores the power estimation information.
     """
 
+    __slots__ = ('power', 'emission', 'sci')
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, power: float, emission: float, sci: float, metadata: Dict[str, Any] = {}):
         """
         Initialize a Power report using the given parameters.
@@ -120,7 +122,7 @@ class PowerReport(Report):
         line = {
             'sensor': report.sensor,
             'target': report.target,
-            'timestamp': int(datetime.timestamp(report.timestamp) * 1000),
+            'timestamp': report.timestamp_ms,
             'power': report.power
         }
 
@@ -169,7 +171,7 @@ class PowerReport(Report):
         return {
             'measurement': 'power_consumption',
             'tags': report._gen_tag(tags),
-            'time': str(report.timestamp),
+            'time': report.timestamp_ms,
             'fields': {
                 'power': report.power,
                 'emission': report.emission,
@@ -184,7 +186,7 @@ class PowerReport(Report):
         """
         return {
             'tags': report._gen_tag(tags),
-            'time': int(report.timestamp.timestamp()),
+            'time': report.timestamp_ms // 1000,
             'value': report.power
         }
 
@@ -195,6 +197,17 @@ class PowerReport(Report):
         """
         return PowerReport.to_json(report)
 
+    @staticmethod
+    def to_json(report: PowerReport) -> Dict:
+        """
+        :return: a dictionary, that can be converted into json format, from a given PowerReport
+        """
+        json = Report.to_json(report)
+        json['power'] = report.power
+        json['emission'] = report.emission
+        json['sci'] = report.sci
+        return json
+
     @staticmethod
     def from_mongodb(data: Dict) -> Report:
         """
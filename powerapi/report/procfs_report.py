@@ -54,6 +54,8 @@ class ProcfsReport(Report):
 
     """
 
+    __slots__ = ('usage', 'global_cpu_usage')
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, usage: Dict, global_cpu_usage: float, metadata: Dict[str, Any] = {}):
         """
         Initialize an Procfs report using the given parameters.
@@ -90,7 +92,13 @@ class ProcfsReport(Report):
 
     @staticmethod
     def to_json(report: ProcfsReport) -> Dict:
-        return report.__dict__
+        """
+        :return: a dictionary, that can be converted into json format, from a given ProcfsReport
+        """
+        json = Report.to_json(report)
+        json['usage'] = report.usage
+        json['global_cpu_usage'] = report.global_cpu_usage
+        return json
 
     @staticmethod
     def from_mongodb(data: Dict) -> ProcfsReport:
@@ -30,12 +30,69 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, NewType, Tuple, List, Any
+from functools import lru_cache
+from typing import Dict, NewType, Tuple, List, Any, Union, Callable
 from powerapi.exception import PowerAPIExceptionWithMessage
 from powerapi.message import Message
 
 CSV_HEADER_COMMON = ['timestamp', 'sensor', 'target']
 CsvLines = NewType('CsvLines', Tuple[List[str], Dict[str, str]])
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+@lru_cache(maxsize=None)
+def _state_attributes(report_type: type) -> Tuple[str, ...]:
+    """
+    :return: name of the attributes declared in the __slots__ of the given report type and its parents
+    """
+    names = []
+    for klass in reversed(report_type.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        names += [slots] if isinstance(slots, str) else list(slots)
+    return tuple(names)
+
+
+def _parse_epoch_timestamp(timestamp: str) -> int:
+    return int(timestamp)
+
+
+def _parse_formated_timestamp(timestamp: str) -> datetime:
+    return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+
+
+class TimestampParser:
+    """
+    Parse timestamp strings that are either an epoch in milliseconds or a date formated with TIMESTAMP_FORMAT
+
+    The format of the last parsed timestamp is tried first, so the format of a stream is only detected once instead of
+    raising and catching an exception for each of its timestamps
+    """
+
+    def __init__(self):
+        self.parsers = [_parse_epoch_timestamp, _parse_formated_timestamp]
+
+    def parse(self, timestamp: str) -> Union[int, datetime]:
+        """
+        :return: the epoch in milliseconds or the datetime read from the given string
+        :raise ValueError: if the string isn't formated with a known format
+        """
+        for parser in self.parsers:
+            try:
+                value = parser(timestamp)
+            except ValueError:
+                continue
+            if parser is not self.parsers[0]:
+                self._set_first(parser)
+            return value
+        raise ValueError('timestamp string have to be an epoch in milliseconds or formated with the following format "' +
+                         TIMESTAMP_FORMAT + '"')
+
+    def _set_first(self, parser: Callable):
+        self.parsers.remove(parser)
+        self.parsers.insert(0, parser)
+
+
+_timestamp_parser = TimestampParser()
 
 
 class BadInputData(PowerAPIExceptionWithMessage):
@@ -51,24 +108,103 @@ class BadInputData(PowerAPIExceptionWithMessage):
 class Report(Message):
     """
     Report abtract class.
+
+    Report timestamp is stored as it was given to the constructor : an integer epoch in milliseconds or a datetime. The
+    timestamp attribute return a datetime, computed on first access, and the timestamp_ms attribute return the epoch.
+
+    Report metadata is shared with the dictionary given to the constructor and only copied when it is modified with
+    the set_metadata or update_metadata methods. The dictionary returned by the metadata attribute must not be modified
+    in place.
     """
 
-    def __init__(self, timestamp: datetime, sensor: str, target: str, metadata: Dict[str, Any] = {}):
+    __slots__ = ('_timestamp', '_timestamp_ms', 'sensor', 'target', '_metadata', '_metadata_shared', 'dispatcher_report_id')
+
+    def __init__(self, timestamp: Union[datetime, int], sensor: str, target: str, metadata: Dict[str, Any] = {}):
         """
         Initialize a report using the given parameters.
-        :param datetime timestamp: Timestamp
+        :param timestamp: Timestamp, as a datetime or an integer epoch in milliseconds
         :param str sensor: Sensor name.
         :param str target: Target name.
+        :param dict metadata: Metadata values, shared with the report until it is modified
         """
         Message.__init__(self, None)
         self.timestamp = timestamp
         self.sensor = sensor
         self.target = target
-        self.metadata = dict(metadata)
+        self._metadata = metadata
+        self._metadata_shared = True
 
         #: id given by the dispatcher actor in order manage report order
         self.dispatcher_report_id = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """
+        :return: report timestamp as a datetime
+        """
+        if self._timestamp is None and self._timestamp_ms is not None:
+            self._timestamp = datetime.fromtimestamp(self._timestamp_ms / 1000)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, timestamp: Union[datetime, int]):
+        if isinstance(timestamp, int):
+            self._timestamp = None
+            self._timestamp_ms = timestamp
+        else:
+            self._timestamp = timestamp
+            self._timestamp_ms = None
+
+    @property
+    def timestamp_ms(self) -> int:
+        """
+        :return: report timestamp as an integer epoch in milliseconds
+        """
+        if self._timestamp_ms is None and self._timestamp is not None:
+            self._timestamp_ms = int(self._timestamp.timestamp() * 1000)
+        return self._timestamp_ms
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        :return: report metadata, this dictionary could be shared with other reports and must not be modified in place
+        """
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]):
+        self._metadata = metadata
+        self._metadata_shared = True
+
+    def _own_metadata(self) -> Dict[str, Any]:
+        if self._metadata_shared:
+            self._metadata = dict(self._metadata)
+            self._metadata_shared = False
+        return self._metadata
+
+    def set_metadata(self, name: str, value: Any):
+        """
+        Set a metadata value, the metadata dictionary is copied if it is shared with other reports
+        """
+        self._own_metadata()[name] = value
+
+    def update_metadata(self, metadata: Dict[str, Any]):
+        """
+        Update metadata with the given values, the metadata dictionary is copied if it is shared with other reports
+        """
+        self._own_metadata().update(metadata)
+
+    def __getstate__(self):
+        values = tuple(getattr(self, name, None) for name in _state_attributes(type(self)))
+        return values, getattr(self, '__dict__', None)
+
+    def __setstate__(self, state):
+        values, attributes = state
+        for name, value in zip(_state_attributes(type(self)), values):
+            setattr(self, name, value)
+        if attributes:
+            self.__dict__.update(attributes)
+
     def __str__(self):
         return '%s(%s, %s, %s)' % (self.__class__.__name__, self.timestamp, self.sensor, self.target)
 
@@ -87,23 +223,26 @@ class Report(Message):
         """
         :return: a json dictionary, that can be converted into json format, from a given Report
         """
-        return report.__dict__
+        return {
+            'timestamp': report.timestamp,
+            'sensor': report.sensor,
+            'target': report.target,
+            'metadata': report.metadata,
+        }
 
     @staticmethod
-    def _extract_timestamp(ts):
+    def _extract_timestamp(ts) -> Union[datetime, int]:
+        """
+        :return: the given timestamp as a datetime or as an integer epoch in milliseconds, without conversion between the
+                 two representations
+        """
         if isinstance(ts, str):
-            try:
-                return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%f")
-            except ValueError:
-                try:
-                    return datetime.fromtimestamp(int(ts) / 1000)
-                except ValueError:
-                    ValueError('timestamp string have to be formated with the following format "%Y-%m-%dT%H:%M:%S.%f"')
+            return _timestamp_parser.parse(ts)
 
-        if isinstance(ts, datetime):
+        if isinstance(ts, (datetime, int)):
             return ts
 
-        raise ValueError('timestamp must be a datetime.datetime or a string')
+        raise ValueError('timestamp must be a datetime.datetime, an integer or a string')
 
     @staticmethod
     def create_empty_report():
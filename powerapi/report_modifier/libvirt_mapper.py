@@ -61,7 +61,7 @@ class LibvirtMapper(ReportModifier):
             domain_name = result.groups(0)[0]
             try:
                 domain = self.libvirt.lookupByName(domain_name)
-                report.metadata["domain_id"] = domain.UUIDString()
+                report.set_metadata("domain_id", domain.UUIDString())
             except libvirtError:
                 pass
         return report
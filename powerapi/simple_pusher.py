@@ -30,7 +30,7 @@ from thespian.actors import ActorAddress, ActorExitRequest
 
 from powerapi.actor import Actor
 from powerapi.message import EndMessage, SimplePusherStartMessage, StartMessage, \
-    GetReceivedReportsSimplePusherMessage, ReceivedReportsSimplePusherMessage
+    GetReceivedReportsSimplePusherMessage, ReceivedReportsSimplePusherMessage, ReportBatch
 from powerapi.report import PowerReport, Report, HWPCReport
 
 
@@ -69,6 +69,17 @@ class SimplePusherActor(Actor):
 
         self.stop_actors_if_required()
 
+    def receiveMsg_ReportBatch(self, message: ReportBatch, _: ActorAddress):
+        """
+        When receiving a batch of reports save each report to the list of reports
+        """
+        self.log_debug('received message ' + str(message))
+        for report in message.reports:
+            self.save_report(report)
+        self.log_debug(str(message) + 'saved to list')
+
+        self.stop_actors_if_required()
+
     def save_report(self, report: Report):
         """
         Saves the received report in a list
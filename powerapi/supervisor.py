@@ -38,7 +38,7 @@ from powerapi.actor import InitializationException, Actor
 from powerapi.exception import PowerAPIExceptionWithMessage
 from powerapi.pusher import PusherActor
 from powerapi.puller import PullerActor
-from powerapi.dispatcher import DispatcherActor
+from powerapi.dispatcher import DispatcherActor, ShardedDispatcherActor
 
 
 class ActorCrashedException(PowerAPIExceptionWithMessage):
@@ -138,11 +138,14 @@ class Supervisor:
     def launch(self, actor_cls: Type[Actor], start_message: StartMessage):
         """
         create an actor from a given class and send it a start message.
+        A DispatcherActor started with more than one shard is launched as a ShardedDispatcherActor
         :param actor_cls: class used to create the actor
         :param start_message: message used to initialize the actor
         :raise InitializationException: if an error occurs during actor initialization process
         """
         name = start_message.name
+        if issubclass(actor_cls, DispatcherActor) and getattr(start_message, 'shard_number', 1) > 1:
+            actor_cls = ShardedDispatcherActor
         address = self.system.createActor(actor_cls)
         answer = self.system.ask(address, start_message)
 
@@ -159,7 +162,7 @@ class Supervisor:
             self.pushers[name] = address
         elif issubclass(actor_cls, PullerActor):
             self.pullers[name] = address
-        elif issubclass(actor_cls, DispatcherActor):
+        elif issubclass(actor_cls, (DispatcherActor, ShardedDispatcherActor)):
             self.dispatchers[name] = address
         elif not issubclass(actor_cls, Actor):
             raise AttributeError('Actor is not a PowerAPI Actor')
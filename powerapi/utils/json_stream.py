@@ -26,77 +26,145 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import re
+from collections import deque
 
 DEFAULT_BUFFER_SIZE = 4096
 
+_OPENING_BRACKET = 123  # ASCII code of {
+_CLOSING_BRACKET = 125  # ASCII code of }
+_QUOTE = 34  # ASCII code of "
+_BACKSLASH = 92  # ASCII code of \
+
+_STRUCTURAL_CHARS = re.compile(rb'[{}"]')
+_STRING_SPECIAL_CHARS = re.compile(rb'["\\]')
+
 
 class JsonStream:
     """read data received from a input utf-8 byte stream socket as a json stream
 
+    Received bytes are appended to a bytearray. The scan state (position, bracket depth, string and escape state) is
+    kept between two reads, so each received byte is scanned only once and the buffer is only compacted when most of it
+    was consumed. Only the structural characters are inspected, using a compiled regular expression
+
     :param stream_reader:
     :param buffer_size: size of the buffer used to receive data from the socket,
                         it must match the average size of received json string
                         (default 4096 bytes)
     """
 
-    def __init__(self, stream_reader, buffer_size=4096):
+    def __init__(self, stream_reader, buffer_size=DEFAULT_BUFFER_SIZE):
         self.stream_reader = stream_reader
-        self.json_buffer = b''
+        self.json_buffer = bytearray()
         self.buffer_size = buffer_size
         self.open_brackets = 0
 
+        self._pending_objects = deque()
+        self._scan_position = 0
+        self._object_start = 0
+        self._in_string = False
+        self._escape = False
+
     async def _get_bytes(self):
         data = await self.stream_reader.read(n=self.buffer_size)
         return b'' if data is None else data
 
-    def _extract_json_end_position(self, first_new_byte):
+    def feed(self, data: bytes) -> list:
         """
-        Find the first valable report in the stream
+        Append data to the buffer and extract the json objects it completes
+
+        :return: list of json strings completed by the given data
         """
-        i = first_new_byte
-        # print("buffer is ", self.json_buffer[first_new_byte:])
-        if len(self.json_buffer) == 0:
-            return -1
-        if self.json_buffer[0] != 123:   # ASCII code opening bracket
-            return -1
-
-        while i < len(self.json_buffer):
-            if self.json_buffer[i] == 125:  # ASCII code closing bracket
-                self.open_brackets -= 1
-                # print("opening : ", self.open_brackets)
-            elif self.json_buffer[i] == 123:  # ASCII code opening bracket
-                self.open_brackets += 1
-                # print("closing :",self.open_brackets)
+        self.json_buffer += data
+        return self._extract_json_objects()
+
+    def _extract_json_objects(self):
+        buffer = self.json_buffer
+        buffer_length = len(buffer)
+        position = self._scan_position
+        json_objects = []
+
+        if self._escape and position < buffer_length:
+            position += 1
+            self._escape = False
+
+        while position < buffer_length:
             if self.open_brackets == 0:
-                return i
-            i += 1
+                position = buffer.find(b'{', position)
+                if position == -1:
+                    position = buffer_length
+                    break
+                self._object_start = position
+                self.open_brackets = 1
+                position += 1
+            elif self._in_string:
+                match = _STRING_SPECIAL_CHARS.search(buffer, position)
+                if match is None:
+                    position = buffer_length
+                    break
+                position = match.end()
+                if buffer[match.start()] == _BACKSLASH:
+                    if position == buffer_length:
+                        self._escape = True
+                        break
+                    position += 1
+                else:
+                    self._in_string = False
+            else:
+                match = _STRUCTURAL_CHARS.search(buffer, position)
+                if match is None:
+                    position = buffer_length
+                    break
+                position = match.end()
+                char = buffer[match.start()]
+                if char == _QUOTE:
+                    self._in_string = True
+                elif char == _OPENING_BRACKET:
+                    self.open_brackets += 1
+                else:
+                    self.open_brackets -= 1
+                    if self.open_brackets == 0:
+                        json_objects.append(buffer[self._object_start:position].decode('utf-8'))
 
-        return -1
+        self._compact(position)
+        return json_objects
+
+    def _compact(self, position):
+        """
+        Remove consumed bytes from the buffer. The buffer is only shifted when most of it was consumed, so the copy
+        cost is amortized over the received bytes
+        """
+        consumed = self._object_start if self.open_brackets > 0 else position
+        if consumed == len(self.json_buffer):
+            self.json_buffer.clear()
+            self._object_start = 0
+            self._scan_position = 0
+            return
+        if consumed > self.buffer_size and consumed * 2 > len(self.json_buffer):
+            del self.json_buffer[:consumed]
+            position -= consumed
+            self._object_start -= consumed
+        self._scan_position = position
+
+    async def read_json_objects(self) -> list:
+        """
+        read data from the connection and return all the json objects completed by this data
+
+        :return: list of json strings, empty if no json object was completed
+        """
+        json_objects = list(self._pending_objects)
+        self._pending_objects.clear()
+        if json_objects:
+            return json_objects
+        return self.feed(await self._get_bytes())
 
     async def read_json_object(self):
         """
-        return all the json object received from the connection as a iteration of string
+        return the next json object received from the connection as a string, or None if no complete json object was
+        received
         """
-        if len(self.json_buffer) != 0 and self.open_brackets == 0:
-            # Last iteration _extract_json_end_position returned a json_object
-            # and breaked. If the buffer isn't empty wasn't treated, so we have
-            # to treat it
-            first_new_byte = 0
-        else:
-            first_new_byte = len(self.json_buffer)
-            self.json_buffer += await self._get_bytes()
-        i = self._extract_json_end_position(first_new_byte)
-
-        if i == -1:
+        if not self._pending_objects:
+            self._pending_objects.extend(self.feed(await self._get_bytes()))
+        if not self._pending_objects:
             return None
-        if i == len(self.json_buffer) - 1:
-            json_str = self.json_buffer[:]
-            self.json_buffer = b''
-            # print("buffer empty")
-            # print(self.open_brackets)
-        else:
-            json_str = self.json_buffer[:i + 1]
-            self.json_buffer = self.json_buffer[i + 1:]
-            # print("buffer non empty ")
-            # print(self.open_brackets)
-        return json_str.decode('utf-8')
+        return self._pending_objects.popleft()
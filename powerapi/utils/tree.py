@@ -27,9 +27,6 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from copy import deepcopy
-from functools import reduce
-
 
 class Tree:
     """
@@ -65,6 +62,8 @@ class Tree:
         """
         Retrieves all leafs value under the node designating by path
 
+        The returned list is cached until the next modification of the tree under this node and must not be modified
+
         :param path:
         :type path: list
         :rtype: list : list of leafs value
@@ -76,6 +75,27 @@ class Tree:
 
         return self.root.retrieve_leaf_values(path)
 
+    def remove(self, path):
+        """
+        Remove the leaf designated by path and the nodes that don't contain any leaf after its removal
+
+        :param path: path to the leaf
+        :type path: list
+        :raise KeyError: if the tree doesn't contain a leaf with this path
+        """
+        if self.root is None or not path or self.root.label != path[0]:
+            raise KeyError(path)
+
+        if len(path) == 1:
+            if not self.root.is_leaf:
+                raise KeyError(path)
+            self.root = None
+            return
+
+        self.root.remove_leaf(path)
+        if not self.root.children:
+            self.root = None
+
     def leafs(self):
         """
         Return a list of all (path, leaf)
@@ -113,7 +133,8 @@ class Node:
         Leaf1:D   Leaf2:E   Leaf3:F   Leaf4:G   Leaf5:H
         </pre>
 
-    Label could be any python value
+    Label could be any hashable python value. Child nodes are stored in a dictionary indexed by their label and the
+    list of leafs value of each node is cached until a leaf is added or removed under this node
 
     """
 
@@ -121,8 +142,16 @@ class Node:
         self.label = label
         self.is_leaf = (val is not None)
 
-        self.childs = []
+        self.children = {}
         self.val = val
+        self._leaf_values = None
+
+    @property
+    def childs(self):
+        """
+        :return: list of the child nodes
+        """
+        return list(self.children.values())
 
     def get_childs(self):
         """
@@ -134,7 +163,7 @@ class Node:
             return [([self.label], self.val)]
 
         result = []
-        for node in self.childs:
+        for node in self.children.values():
             for path, val in node.get_childs():
                 result.append(([self.label] + path, val))
         return result
@@ -143,34 +172,44 @@ class Node:
         """
         Add a leaf to the tree
 
-        create unexistant node between the root node and the new leaf
+        create unexistant node between the root node and the new leaf, a leaf
+        that already exists with the same path is replaced
 
         :param list path: path to the node, its length must be equal to the
                           depth of the tree and the last label of the path
                           will be the label of the leaf
         :param val:       the value that will be stored in the leaf
         """
-        def aux(node, depth):
-            label = path[depth]
-            # if node is the leaf parent, create the leaf and add it to its
-            # parent
-            if depth == (len(path) - 1):
-                node.childs.append(Node(label, val=val))
-            # otherwise find the next node in the path and go down in the tree
-            else:
-                child_found = False
-                for child in node.childs:
-                    if child.label == label:
-                        aux(child, depth + 1)
-                        child_found = True
-                        break
-                # if no intermediate node, create it
-                if not child_found:
-                    child = Node(label)
-                    node.childs.append(child)
-                    aux(child, depth + 1)
-
-        aux(self, 1)
+        node = self
+        node._leaf_values = None
+        for label in path[1:-1]:
+            child = node.children.get(label)
+            if child is None:
+                child = Node(label)
+                node.children[label] = child
+            child._leaf_values = None
+            node = child
+        node.children[path[-1]] = Node(path[-1], val=val)
+
+    def remove_leaf(self, path):
+        """
+        Remove the leaf designated by path, intermediate nodes that don't have child anymore are removed too
+
+        :param list path: path to the leaf, starting with the label of this node
+        :raise KeyError: if no leaf exists with this path
+        """
+        nodes = [self]
+        for label in path[1:]:
+            if label not in nodes[-1].children:
+                raise KeyError(path)
+            nodes.append(nodes[-1].children[label])
+        if not nodes[-1].is_leaf:
+            raise KeyError(path)
+
+        for parent, child in zip(reversed(nodes[:-1]), reversed(nodes[1:])):
+            parent._leaf_values = None
+            if child.is_leaf or not child.children:
+                del parent.children[child.label]
 
     def retrieve_leaf_values(self, path):
         """retrieves all leafs value under the node designating by path
@@ -179,18 +218,15 @@ class Node:
         :type path: list
         :rtype: list : list of leafs value
         """
-        def aux(node, depth):
-            label = path[depth]
-            # if the current node is not in the path go back to the upper node
-            if label != node.label:
-                return []
-            # if the current node is a leaf return its value
-            if depth == (len(path) - 1):
-                return node._get_leafs()
+        if not path or path[0] != self.label:
+            return []
 
-            # go down in all child nodes
-            return reduce(lambda acc, child: acc + aux(child, depth + 1), node.childs, [])
-        return aux(self, 0)
+        node = self
+        for label in path[1:]:
+            node = node.children.get(label)
+            if node is None:
+                return []
+        return node._get_leafs()
 
     def _get_leafs(self):
         """
@@ -198,20 +234,19 @@ class Node:
         """
         if self.is_leaf:
             return [self.val]
-        # concat all leafs value of the node's childs
-        return reduce(lambda acc, child: acc + child._get_leafs(), self.childs,
-                      [])
+
+        if self._leaf_values is None:
+            leaf_values = []
+            for child in self.children.values():
+                if child.is_leaf:
+                    leaf_values.append(child.val)
+                else:
+                    leaf_values.extend(child._get_leafs())
+            self._leaf_values = leaf_values
+        return self._leaf_values
 
     def __eq__(self, other):
         if not isinstance(other, Node):
             return False
-        if (self.label != other.label or self.val != other.val or self.is_leaf != other.is_leaf):
-            return False
-        sorted_child = deepcopy(self.childs)
-        sorted_child.sort(key=lambda node: node.label)
-        sorted_child2 = deepcopy(other.childs)
-        sorted_child2.sort(key=lambda node: node.label)
-        for node, other_node in zip(sorted_child, sorted_child2):
-            if node != other_node:
-                return False
-        return True
+        return (self.label == other.label and self.val == other.val and self.is_leaf == other.is_leaf and
+                self.children == other.children)
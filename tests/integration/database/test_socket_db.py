@@ -27,14 +27,17 @@ import json
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+import os
+import time
 from datetime import datetime
-from socket import socket
+from socket import socket, AF_UNIX
 from threading import Thread
 
 import pytest
 import pytest_asyncio
 
-from powerapi.database import SocketDB
+from powerapi.database import SocketDB, UnixSocketDB, AsyncDBReader, DBError
 from powerapi.report import HWPCReport
 from powerapi.test_utils.report.hwpc import extract_rapl_reports_with_2_sockets
 
@@ -55,6 +58,28 @@ class ClientThread(Thread):
         self.socket.close()
 
 
+class FramedClientThread(Thread):
+
+    def __init__(self, msg_list, port, framing):
+        Thread.__init__(self)
+
+        self.msg_list = msg_list
+        self.socket = socket()
+        self.port = port
+        self.framing = framing
+
+    def run(self):
+        self.socket.connect(('localhost', self.port))
+        for msg in self.msg_list:
+            data = bytes(json.dumps(msg), 'utf-8')
+            if self.framing == 'ndjson':
+                data += b'\n'
+            else:
+                data = len(data).to_bytes(4, 'big') + data
+            self.socket.send(data)
+        self.socket.close()
+
+
 def assert_report_equals(hwpc_report, json_report):
     assert isinstance(hwpc_report, HWPCReport)
     assert hwpc_report.target == json_report['target']
@@ -98,3 +123,142 @@ async def test_read_two_json_object_received_from_the_socket(socket_db, unused_t
 
     report = await iterator.__anext__()
     assert_report_equals(report, json_reports[1])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('framing', ['ndjson', 'length-prefixed'])
+async def test_read_two_json_object_received_from_the_socket_with_framing(framing, unused_tcp_port):
+    socket_db = SocketDB(HWPCReport, unused_tcp_port, framing=framing)
+    await socket_db.connect()
+    json_reports = extract_rapl_reports_with_2_sockets(2)
+    client = FramedClientThread(json_reports, unused_tcp_port, framing)
+    client.start()
+
+    iterator = socket_db.iter(False)
+
+    report = await iterator.__anext__()
+    assert_report_equals(report, json_reports[0])
+
+    report = await iterator.__anext__()
+    assert_report_equals(report, json_reports[1])
+    await socket_db.stop()
+
+
+async def fill_socket_db_queue(overflow_policy, port):
+    socket_db = SocketDB(HWPCReport, port, framing='ndjson', queue_size=2, overflow_policy=overflow_policy)
+    await socket_db.connect()
+    json_reports = extract_rapl_reports_with_2_sockets(5)
+    client = FramedClientThread(json_reports, port, 'ndjson')
+    client.start()
+    await asyncio.sleep(0.5)
+    return socket_db, json_reports
+
+
+@pytest.mark.asyncio
+async def test_socket_db_with_full_queue_and_drop_newest_policy_drop_received_reports(unused_tcp_port):
+    socket_db, json_reports = await fill_socket_db_queue('drop-newest', unused_tcp_port)
+    assert socket_db.get_stats() == {'enqueued': 2, 'dropped': 3, 'depth': 2}
+
+    iterator = socket_db.iter(False)
+    assert_report_equals(await iterator.__anext__(), json_reports[0])
+    assert_report_equals(await iterator.__anext__(), json_reports[1])
+    await socket_db.stop()
+
+
+@pytest.mark.asyncio
+async def test_socket_db_with_full_queue_and_drop_oldest_policy_keep_last_received_reports(unused_tcp_port):
+    socket_db, json_reports = await fill_socket_db_queue('drop-oldest', unused_tcp_port)
+    assert socket_db.get_stats() == {'enqueued': 5, 'dropped': 3, 'depth': 2}
+
+    iterator = socket_db.iter(False)
+    assert_report_equals(await iterator.__anext__(), json_reports[3])
+    assert_report_equals(await iterator.__anext__(), json_reports[4])
+    await socket_db.stop()
+
+
+@pytest.mark.asyncio
+async def test_socket_db_with_full_queue_and_block_policy_dont_lose_reports(unused_tcp_port):
+    socket_db, json_reports = await fill_socket_db_queue('block', unused_tcp_port)
+    assert socket_db.get_stats() == {'enqueued': 2, 'dropped': 0, 'depth': 2}
+
+    iterator = socket_db.iter(False)
+    for json_report in json_reports:
+        assert_report_equals(await iterator.__anext__(), json_report)
+    assert socket_db.get_stats() == {'enqueued': 5, 'dropped': 0, 'depth': 0}
+    await socket_db.stop()
+
+
+@pytest.mark.asyncio
+async def test_connect_socket_db_with_unknow_framing_raise_DBError(unused_tcp_port):
+    socket_db = SocketDB(HWPCReport, unused_tcp_port, framing='xml')
+    with pytest.raises(DBError):
+        await socket_db.connect()
+
+
+class UnixClientThread(Thread):
+
+    def __init__(self, msg_list, path):
+        Thread.__init__(self)
+
+        self.msg_list = msg_list
+        self.socket = socket(AF_UNIX)
+        self.path = path
+
+    def run(self):
+        self.socket.connect(self.path)
+        for msg in self.msg_list:
+            self.socket.send(bytes(json.dumps(msg), 'utf-8'))
+        self.socket.close()
+
+
+@pytest.mark.asyncio
+async def test_read_two_json_object_received_from_the_unix_socket(tmp_path):
+    path = str(tmp_path / 'powerapi.sock')
+    unix_socket_db = UnixSocketDB(HWPCReport, path)
+    await unix_socket_db.connect()
+    json_reports = extract_rapl_reports_with_2_sockets(2)
+    client = UnixClientThread(json_reports, path)
+    client.start()
+
+    iterator = unix_socket_db.iter(False)
+
+    report = await iterator.__anext__()
+    assert_report_equals(report, json_reports[0])
+
+    report = await iterator.__anext__()
+    assert_report_equals(report, json_reports[1])
+    await unix_socket_db.stop()
+    assert not os.path.exists(path)
+
+
+@pytest.fixture
+def async_db_reader(unused_tcp_port):
+    reader = AsyncDBReader(SocketDB(HWPCReport, unused_tcp_port), True)
+    reader.start()
+    yield reader
+    reader.stop()
+
+
+def test_async_db_reader_without_data_received_return_None_without_blocking(async_db_reader):
+    begin = time.time()
+    assert async_db_reader.get() is None
+    assert time.time() - begin < 0.5
+
+
+def test_async_db_reader_return_two_json_object_received_from_the_socket(async_db_reader, unused_tcp_port):
+    json_reports = extract_rapl_reports_with_2_sockets(2)
+    client = ClientThread(json_reports, unused_tcp_port)
+    client.start()
+
+    reports = []
+    for _ in range(100):
+        report = async_db_reader.get()
+        if report is not None:
+            reports.append(report)
+        if len(reports) == 2:
+            break
+        time.sleep(0.02)
+
+    assert len(reports) == 2
+    assert_report_equals(reports[0], json_reports[0])
+    assert_report_equals(reports[1], json_reports[1])
@@ -34,7 +34,7 @@ from mock import Mock, patch
 from powerapi.cli.generator import PullerGenerator, PusherGenerator, DBActorGenerator
 from powerapi.cli.generator import ModelNameDoesNotExist, DatabaseNameDoesNotExist
 from powerapi.puller import PullerActor
-from powerapi.database import MongoDB
+from powerapi.database import MongoDB, UnixSocketDB
 from powerapi.message import PullerStartMessage, PusherStartMessage
 from powerapi.exception import PowerAPIException
 ####################
@@ -90,6 +90,32 @@ def test_generate_puller_from_simple_config():
     assert db.collection_name == 'tutu'
 
 
+def test_generate_puller_with_pull_options_set_them_in_start_message():
+    args = {'verbose': True, 'stream': True, 'pull_batch_size': 500, 'pull_min_interval': 0.01,
+            'pull_max_interval': 2.0, 'input': {'toto': {'model': 'HWPCReport', 'type': 'socket', 'port': 1111}}}
+    generator = PullerGenerator(None, [])
+    result = generator.generate(args)
+
+    _, start_message = result['toto']
+    assert start_message.batch_size == 500
+    assert start_message.batch_time == 0.5
+    assert start_message.min_interval == 0.01
+    assert start_message.max_interval == 2.0
+
+
+def test_generate_puller_with_unix_socket_input():
+    args = {'verbose': True, 'stream': True, 'input': {'toto': {'model': 'HWPCReport', 'type': 'unix_socket',
+                                                                'path': '/tmp/powerapi.sock', 'framing': 'ndjson'}}}
+    generator = PullerGenerator(None, [])
+    result = generator.generate(args)
+
+    _, start_message = result['toto']
+    db = start_message.database
+    assert isinstance(db, UnixSocketDB)
+    assert db.path == '/tmp/powerapi.sock'
+    assert db.framing == 'ndjson'
+
+
 def test_generate_two_pusher():
     """
     generate two mongodb puller from this config :
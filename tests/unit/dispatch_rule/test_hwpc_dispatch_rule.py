@@ -253,3 +253,45 @@ def test_get_formula_id_cpu_rule_report_3(report_3):
     ids = HWPCDispatchRule(HWPCDepthLevel.CORE).get_formula_id(report_3)
     validate_formula_id(ids, [('toto', '1', '1'), ('toto', '1', '2'),
                               ('toto', '2', '3'), ('toto', '2', '4')])
+
+
+##############################
+# TEST WITH COLUMNAR REPORTS #
+##############################
+def to_columnar_report(report):
+    return HWPCReport.from_columnar_groups(report.timestamp, report.sensor, report.target, report.columnar_groups)
+
+
+@pytest.mark.parametrize('depth', [HWPCDepthLevel.TARGET, HWPCDepthLevel.ROOT, HWPCDepthLevel.SOCKET, HWPCDepthLevel.CORE])
+def test_get_formula_id_from_columnar_report_return_same_ids_than_from_dict_report(report, depth):
+    columnar_report = to_columnar_report(report)
+    assert columnar_report.has_columnar_groups()
+    ids = HWPCDispatchRule(depth).get_formula_id(columnar_report)
+    validate_formula_id(ids, sorted(HWPCDispatchRule(depth).get_formula_id(report)))
+
+
+def test_get_formula_id_cpu_rule_on_reports_with_different_shapes_return_ids_of_each_report():
+    rule = HWPCDispatchRule(HWPCDepthLevel.CORE)
+    validate_formula_id(rule.get_formula_id(REPORT_3_RAPL), [('toto', '1', '1'), ('toto', '1', '2'), ('toto', '2', '3'), ('toto', '2', '4')])
+    validate_formula_id(rule.get_formula_id(REPORT_2_RAPL), [('toto', '1', '1'), ('toto', '1', '2')])
+    validate_formula_id(rule.get_formula_id(REPORT_2_RAPL), [('toto', '1', '1'), ('toto', '1', '2')])
+    validate_formula_id(rule.get_formula_id(REPORT_3_RAPL), [('toto', '1', '1'), ('toto', '1', '2'), ('toto', '2', '3'), ('toto', '2', '4')])
+
+
+##############
+# PROJECTION #
+##############
+def test_project_report_with_socket_rule_keep_only_formula_socket():
+    sub_report = HWPCDispatchRule(HWPCDepthLevel.SOCKET).project(REPORT_3_RAPL, ('toto', '2'))
+    assert sub_report.groups == {'1': {'2': {'3': {'e0': '2'}, '4': {'e0': '3'}}}}
+
+
+def test_project_report_with_cpu_rule_keep_formula_core_and_shared_group_socket():
+    sub_report = HWPCDispatchRule(HWPCDepthLevel.CORE).project(REPORT_2_RAPL, ('toto', '1', '2'))
+    assert sub_report.groups == {'1': {'1': {'2': {'e0': '1'}}}, 'RAPL': {'1': {'1': {'e0': '0'}}}}
+    assert sub_report.sensor == REPORT_2_RAPL.sensor
+    assert sub_report.timestamp == REPORT_2_RAPL.timestamp
+
+
+def test_project_report_with_sensor_rule_return_report():
+    assert HWPCDispatchRule(HWPCDepthLevel.ROOT).project(REPORT_3_RAPL, ('toto',)) is REPORT_3_RAPL
@@ -34,11 +34,12 @@ from powerapi.test_utils.actor import is_actor_alive, system
 from powerapi.test_utils.dummy_actor import DummyActor, DummyFormulaActor, CrashInitFormulaActor, CrashFormulaActor, DummyStartMessage, logger, LOGGER_NAME
 from powerapi.test_utils.abstract_test import AbstractTestActor, recv_from_pipe
 from powerapi.dispatcher import DispatcherActor, RouteTable
-from powerapi.dispatcher.dispatcher_actor import _extract_formula_id
+from powerapi.dispatcher.dispatcher_actor import _extract_formula_id, FormulaNameService
 from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel, DispatchRule
 from powerapi.dispatch_rule import PowerDispatchRule, PowerDepthLevel
-from powerapi.message import OKMessage, ErrorMessage, DispatcherStartMessage, StartMessage, FormulaStartMessage, EndMessage
+from powerapi.message import OKMessage, ErrorMessage, DispatcherStartMessage, StartMessage, FormulaStartMessage, EndMessage, ReportBatch
 from powerapi.formula import FormulaValues
+from powerapi.formula.simple_formula_actor import SimpleFormulaActor
 from powerapi.dispatch_rule import DispatchRule
 from powerapi.report import Report, HWPCReport, PowerReport
 from powerapi.database import MongoDB
@@ -317,6 +318,29 @@ class TestDispatcher(AbstractTestActor):
 
         assert recv_from_pipe(dummy_pipe_out, 0.5) == (None,None)
 
+    @define_dispatch_rules([(Report1, DispatchRule1AB(primary=True))])
+    def test_send_ReportBatch_to_dispatcher_with_two_formula_forward_one_sub_batch_to_each_formula(self, system, dispatcher_with_two_formula, dummy_pipe_out):
+        system.tell(dispatcher_with_two_formula, ReportBatch('system', [REPORT_1, Report1('a', 'c'), REPORT_1]))
+        _, msg1 = recv_from_pipe(dummy_pipe_out, 0.5)
+        _, msg2 = recv_from_pipe(dummy_pipe_out, 0.5)
+
+        assert isinstance(msg1, ReportBatch)
+        assert isinstance(msg2, ReportBatch)
+        batches = sorted([msg1.reports, msg2.reports], key=len)
+        assert batches == [[Report1('a', 'c')], [REPORT_1, REPORT_1]]
+        assert recv_from_pipe(dummy_pipe_out, 0.5) == (None, None)
+
+    @define_dispatch_rules([(Report1, DispatchRule1AB(primary=True))])
+    def test_send_ReportBatch_with_dispatch_rule_for_Report1_and_no_formula_created_must_create_formula_and_forward_reports(self, system, started_actor, dummy_pipe_out):
+        system.tell(started_actor, ReportBatch('system', [REPORT_1, REPORT_1]))
+        _, start_msg = recv_from_pipe(dummy_pipe_out, 0.5)
+        assert isinstance(start_msg, StartMessage)
+        assert start_msg.name == 'formula0__a__b'
+
+        for _ in range(2):
+            _, msg = recv_from_pipe(dummy_pipe_out, 0.5)
+            assert msg == REPORT_1
+
     @define_dispatch_rules([(Report1, DispatchRule1AB(primary=True))])
     def test_send_REPORT1_B2_with_dispatch_rule_1AB_must_create_two_formula(self, system, started_actor, dummy_pipe_out):
         system.tell(started_actor, REPORT_1_B2)
@@ -470,3 +494,64 @@ def test_extract_formula_id_with_pgb_DispatchRule1AB_gb_DispatchRule2AC_on_REPOR
     pgb = DispatchRule1AB(primary=True)
     gen_test_extract_formula_id(pgb, DispatchRule2AC(), REPORT_2, [('a',)])
     gen_test_extract_formula_id(pgb, DispatchRule2AC(), REPORT_2_C2, [('a',)])
+
+
+########################
+# FORMULA NAME SERVICE #
+########################
+def test_formula_name_service_return_formula_id_and_name_of_added_formula():
+    service = FormulaNameService()
+    service.add(('a', 'b'), 'formula0')
+    service.add(('a', 'c'), 'formula1')
+    assert service.get_formula_id('formula1') == ('a', 'c')
+    assert service.get_direct_formula_name(('a', 'b')) == 'formula0'
+    assert sorted(service.get_corresponding_formula(['a'])) == ['formula0', 'formula1']
+
+
+def test_remove_formula_from_formula_name_service_remove_it_from_corresponding_formula():
+    service = FormulaNameService()
+    service.add(('a', 'b'), 'formula0')
+    service.add(('a', 'c'), 'formula1')
+    service.remove_formula('formula0')
+    assert service.get_formula_id('formula0') is None
+    assert service.get_corresponding_formula(['a']) == ['formula1']
+
+
+def test_remove_unknow_formula_from_formula_name_service_raise_AttributeError():
+    service = FormulaNameService()
+    with pytest.raises(AttributeError):
+        service.remove_formula('formula0')
+
+
+class TestDispatcherWithFormulaHosts(TestDispatcher):
+    """
+    Run the dispatcher tests with formulas run by two formula hosts
+    """
+
+    @pytest.fixture
+    def actor_start_message(self, dispatch_rules, logger, formula_class):
+        route_table = RouteTable()
+        for report_type, gbr in dispatch_rules:
+            route_table.dispatch_rule(report_type, gbr)
+        values = FormulaValues({'fake_pusher': LOGGER_NAME})
+        return DispatcherStartMessage('system', 'dispatcher', formula_class, values, route_table, 'test_device',
+                                      formula_host_number=2)
+
+    @define_dispatch_rules([(Report1, DispatchRule1AB(primary=True))])
+    def test_send_EndMessage_to_dispatcher_with_hosted_formulas_send_EndMessage_to_pusher_when_formulas_exited(self, system, actor, dispatch_rules, logger, dummy_pipe_out):
+        route_table = RouteTable()
+        for report_type, gbr in dispatch_rules:
+            route_table.dispatch_rule(report_type, gbr)
+        values = FormulaValues({'fake_pusher': logger})
+        system.ask(actor, DispatcherStartMessage('system', 'dispatcher', SimpleFormulaActor, values, route_table,
+                                                 'test_device', formula_host_number=2))
+        system.tell(actor, REPORT_1)
+        system.tell(actor, Report1('a', 'c'))
+        reports = [recv_from_pipe(dummy_pipe_out, 0.5)[1] for _ in range(2)]
+        assert sorted(reports, key=lambda report: report.b) == [REPORT_1, Report1('a', 'c')]
+
+        system.tell(actor, EndMessage('system'))
+        _, msg = recv_from_pipe(dummy_pipe_out, 1)
+        assert isinstance(msg, EndMessage)
+        assert msg.sender_name == 'dispatcher'
+        assert recv_from_pipe(dummy_pipe_out, 0.5) == (None, None)
@@ -0,0 +1,76 @@
+# Copyright (c) 2021, INRIA
+# Copyright (c) 2021, University of Lille
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from powerapi.dispatcher import RouteTable
+from powerapi.dispatch_rule import DispatchRule
+from powerapi.report import Report, HWPCReport
+
+
+class FieldsDispatchRule(DispatchRule):
+
+    def __init__(self, fields, primary=False):
+        DispatchRule.__init__(self, primary)
+        self.fields = fields
+
+    def get_formula_id(self, report):
+        return []
+
+
+class SubHWPCReport(HWPCReport):
+    pass
+
+
+def test_get_dispatch_rule_of_report_subclass_return_dispatch_rule_of_parent_class():
+    route_table = RouteTable()
+    rule = FieldsDispatchRule(['sensor'], primary=True)
+    route_table.dispatch_rule(HWPCReport, rule)
+
+    assert route_table.get_dispatch_rule(SubHWPCReport.create_empty_report()) is rule
+    assert route_table.get_dispatch_rule(SubHWPCReport(None, None, None, {})) is rule
+    assert route_table.get_dispatch_rule(Report(None, None, None)) is None
+
+
+def test_get_dispatch_rule_after_adding_a_rule_return_new_rule():
+    route_table = RouteTable()
+    report = Report(None, None, None)
+    assert route_table.get_dispatch_rule(report) is None
+
+    rule = FieldsDispatchRule(['sensor'], primary=True)
+    route_table.dispatch_rule(Report, rule)
+    assert route_table.get_dispatch_rule(report) is rule
+
+
+def test_get_primary_prefix_length_return_number_of_fields_matching_primary_rule_fields():
+    route_table = RouteTable()
+    rule = FieldsDispatchRule(['sensor', 'socket'])
+    route_table.dispatch_rule(Report, rule)
+    route_table.dispatch_rule(HWPCReport, FieldsDispatchRule(['sensor', 'socket', 'core'], primary=True))
+
+    assert route_table.get_primary_prefix_length(rule) == 2
+    assert route_table.get_primary_prefix_length(FieldsDispatchRule(['sensor', 'target'])) == 1
+    assert route_table.get_primary_prefix_length(FieldsDispatchRule(['target'])) == 0
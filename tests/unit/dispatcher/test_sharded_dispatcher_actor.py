@@ -0,0 +1,111 @@
+# Copyright (c) 2022, INRIA
+# Copyright (c) 2022, University of Lille
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import pytest
+
+from thespian.actors import ActorExitRequest
+
+from powerapi.test_utils.actor import system
+from powerapi.test_utils.dummy_actor import DummyFormulaActor, logger, LOGGER_NAME
+from powerapi.test_utils.abstract_test import AbstractTestActor, recv_from_pipe
+from powerapi.dispatcher import ShardedDispatcherActor, RouteTable
+from powerapi.dispatcher.dispatcher_actor import get_shard_index
+from powerapi.message import DispatcherStartMessage, StartMessage, EndMessage, ReportBatch
+from powerapi.formula import FormulaValues
+
+from tests.unit.dispatcher.test_dispatcher_actor import Report1, Report2, DispatchRule1AB, DispatchRule2A
+
+SHARD_NUMBER = 2
+
+
+def test_shard_index_is_bounded_by_shard_number_and_stable():
+    for formula_id in [('a', 'b'), ('a', 'c'), ('sensor', 0, 12)]:
+        shard_index = get_shard_index(formula_id, SHARD_NUMBER)
+        assert 0 <= shard_index < SHARD_NUMBER
+        assert get_shard_index(formula_id, SHARD_NUMBER) == shard_index
+
+
+class TestShardedDispatcher(AbstractTestActor):
+
+    @pytest.fixture
+    def actor(self, system):
+        actor = system.createActor(ShardedDispatcherActor)
+        yield actor
+        system.tell(actor, ActorExitRequest())
+
+    @pytest.fixture
+    def actor_start_message(self, logger):
+        route_table = RouteTable()
+        route_table.dispatch_rule(Report1, DispatchRule1AB(primary=True))
+        route_table.dispatch_rule(Report2, DispatchRule2A())
+        values = FormulaValues({'fake_pusher': LOGGER_NAME})
+        return DispatcherStartMessage('system', 'dispatcher', DummyFormulaActor, values, route_table, 'test_device',
+                                      shard_number=SHARD_NUMBER)
+
+    def test_send_Report1_create_formula_on_the_shard_bound_to_the_formula_id(self, system, started_actor, dummy_pipe_out):
+        for b in ['b', 'c', 'd', 'e']:
+            system.tell(started_actor, Report1('a', b))
+            _, start_msg = recv_from_pipe(dummy_pipe_out, 0.5)
+            assert isinstance(start_msg, StartMessage)
+            assert start_msg.name.startswith('shard' + str(get_shard_index(('a', b), SHARD_NUMBER)) + '_formula')
+            assert start_msg.name.endswith('__a__' + b)
+            _, msg = recv_from_pipe(dummy_pipe_out, 0.5)
+            assert msg == Report1('a', b)
+
+    def test_send_ReportBatch_forward_each_report_to_one_formula(self, system, started_actor, dummy_pipe_out):
+        system.tell(started_actor, ReportBatch('system', [Report1('a', b) for b in ['b', 'c', 'd', 'e']]))
+        reports = []
+        for _ in range(8):
+            _, msg = recv_from_pipe(dummy_pipe_out, 0.5)
+            if isinstance(msg, Report1):
+                reports.append(msg)
+        assert sorted(reports, key=lambda report: report.b) == [Report1('a', b) for b in ['b', 'c', 'd', 'e']]
+        assert recv_from_pipe(dummy_pipe_out, 0.5) == (None, None)
+
+    def test_send_Report2_forward_it_to_the_formulas_of_all_shards(self, system, started_actor, dummy_pipe_out):
+        formula_ids = [('a', b) for b in ['b', 'c', 'd', 'e']]
+        assert len({get_shard_index(formula_id, SHARD_NUMBER) for formula_id in formula_ids}) == SHARD_NUMBER
+        for a, b in formula_ids:
+            system.tell(started_actor, Report1(a, b))
+            recv_from_pipe(dummy_pipe_out, 0.5)
+            recv_from_pipe(dummy_pipe_out, 0.5)
+
+        system.tell(started_actor, Report2('a', 'c'))
+        for _ in formula_ids:
+            _, msg = recv_from_pipe(dummy_pipe_out, 0.5)
+            assert msg == Report2('a', 'c')
+        assert recv_from_pipe(dummy_pipe_out, 0.5) == (None, None)
+
+    def test_send_EndMessage_to_sharded_dispatcher_without_formula_send_one_EndMessage_to_pushers(self, system, actor, actor_start_message, logger, dummy_pipe_out):
+        actor_start_message.formula_values = FormulaValues({'fake_pusher': logger})
+        system.ask(actor, actor_start_message)
+        system.tell(actor, EndMessage('system'))
+        _, msg = recv_from_pipe(dummy_pipe_out, 0.5)
+        assert isinstance(msg, EndMessage)
+        assert msg.sender_name == 'dispatcher'
+        assert recv_from_pipe(dummy_pipe_out, 0.5) == (None, None)
@@ -27,9 +27,12 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+import pickle
+
 import pytest
 
-from powerapi.report import HWPCReport, BadInputData
+from powerapi.report import HWPCReport, HWPCColumnarGroup, BadInputData
 from datetime import datetime
 
 from powerapi.test_utils.report.hwpc import extract_rapl_reports_with_2_sockets
@@ -147,3 +150,89 @@ def test_create_report_from_csv_with_metadata():
     csv_lines = [('rapl', {'sensor': 'toto', 'timestamp': '1970-09-01T09:09:09.543', 'target': 'all', 'socket': '0', 'cpu': '7', 'RAPL_VALUE': '1234', 'tag':1})]
     report = HWPCReport.from_csv_lines(csv_lines)
     assert report.metadata["tag"] == 1
+
+
+def test_set_metadata_of_report_dont_modify_metadata_shared_with_other_report():
+    metadata = {"tag": 1}
+    report1 = HWPCReport(datetime.fromtimestamp(0), 'toto', 'all', {}, metadata)
+    report2 = HWPCReport(datetime.fromtimestamp(0), 'toto', 'all', {}, metadata)
+    report1.set_metadata("tag", 2)
+    assert report1.metadata == {"tag": 2}
+    assert report2.metadata == {"tag": 1}
+    assert metadata == {"tag": 1}
+
+
+def test_hwpc_report_dont_have_instance_dict():
+    report = HWPCReport(datetime.fromtimestamp(0), 'toto', 'all', {}, {"tag": 1})
+    assert not hasattr(report, '__dict__')
+
+
+def test_pickled_hwpc_report_is_equal_to_original_report():
+    report = HWPCReport.from_json(extract_rapl_reports_with_2_sockets(1)[0])
+    report.dispatcher_report_id = 3
+    unpickled_report = pickle.loads(pickle.dumps(report))
+    assert unpickled_report == report
+    assert unpickled_report.groups == report.groups
+    assert unpickled_report.dispatcher_report_id == 3
+
+
+def test_hwpc_report_to_json_return_report_fields():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    report = HWPCReport.from_json(json_input)
+    json_output = HWPCReport.to_json(report)
+    assert set(json_output.keys()) == {'timestamp', 'sensor', 'target', 'metadata', 'groups'}
+    assert json_output['groups'] == json_input['groups']
+
+
+############
+# COLUMNAR #
+############
+def test_convert_hwpc_report_groups_to_columnar_groups_and_back_return_same_groups():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    report = HWPCReport.from_json(json_input)
+    columnar_report = HWPCReport.from_columnar_groups(report.timestamp, report.sensor, report.target, report.columnar_groups)
+    assert columnar_report.groups == json_input['groups']
+
+
+def test_columnar_group_values_are_indexed_by_socket_core_and_event():
+    group = HWPCColumnarGroup.from_dict({'0': {'0': {'e0': 1, 'e1': 2}, '1': {'e0': 3, 'e1': 4}},
+                                         '1': {'2': {'e0': 5, 'e1': 6}, '3': {'e0': 7, 'e1': 8}}})
+    assert group.values.shape == (2, 2, 2)
+    assert group.cores == [['0', '1'], ['2', '3']]
+    assert group.get_event('e1').tolist() == [[2, 4], [6, 8]]
+    assert group.get_socket('1').tolist() == [[5, 6], [7, 8]]
+
+
+def test_columnar_group_from_irregular_dict_pad_missing_cores_and_events():
+    group_dict = {'0': {'0': {'e0': 1}, '1': {'e0': 2, 'e1': 3}}, '1': {'2': {'e0': 4}}}
+    group = HWPCColumnarGroup.from_dict(group_dict)
+    assert group.cores == [['0', '1'], ['2', None]]
+    assert group.values.tolist() == [[[1, 0], [2, 3]], [[4, 0], [0, 0]]]
+    assert group.to_dict() == {'0': {'0': {'e0': 1, 'e1': 0}, '1': {'e0': 2, 'e1': 3}}, '1': {'2': {'e0': 4, 'e1': 0}}}
+
+
+def test_columnar_group_to_json_and_back_return_same_group():
+    group = HWPCColumnarGroup.from_dict({'0': {'0': {'e0': 1, 'e1': 2}}, '1': {'1': {'e0': 3, 'e1': 4}}})
+    assert HWPCColumnarGroup.from_json(json.loads(json.dumps(HWPCColumnarGroup.to_json(group)))) == group
+
+
+#############
+# TIMESTAMP #
+#############
+def test_create_hwpc_report_from_json_with_epoch_timestamp_keep_integer_timestamp():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    json_input['timestamp'] = '1000'
+    report = HWPCReport.from_json(json_input)
+    assert report.timestamp_ms == 1000
+    assert report.timestamp == datetime.fromtimestamp(1)
+
+
+def test_create_hwpc_reports_from_json_with_alternating_timestamp_formats():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    formated_report = HWPCReport.from_json(json_input)
+    json_input['timestamp'] = 1234
+    epoch_report = HWPCReport.from_json(json_input)
+    json_input['timestamp'] = '1970-09-01T09:09:09.543'
+    assert HWPCReport.from_json(json_input).timestamp == datetime(1970, 9, 1, 9, 9, 9, 543000)
+    assert epoch_report.timestamp_ms == 1234
+    assert formated_report.timestamp_ms == int(formated_report.timestamp.timestamp() * 1000)
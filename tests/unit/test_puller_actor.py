@@ -37,7 +37,7 @@ from mock import Mock
 from thespian.actors import ActorExitRequest
 
 from powerapi.puller import PullerActor
-from powerapi.message import PullerStartMessage, ErrorMessage, StartMessage, EndMessage
+from powerapi.message import PullerStartMessage, ErrorMessage, StartMessage, EndMessage, ReportBatch
 from powerapi.filter import Filter, RouterWithoutRuleException
 from powerapi.report import Report
 from powerapi.test_utils.abstract_test import AbstractTestActor, AbstractTestActorWithDB, define_database_content, recv_from_pipe
@@ -127,6 +127,35 @@ class TestPuller(AbstractTestActorWithDB):
         for report in content:
             assert recv_from_pipe(dummy_pipe_out, 2) == ('dispatcher', report)
 
+    @define_database_content([Report(i, 'sensor', 'target') for i in range(25)])
+    def test_start_actor_with_db_that_contains_more_reports_than_batch_size_make_actor_send_all_reports_to_dispatcher(self, system, actor, fake_db, fake_filter, content, dummy_pipe_out):
+        puller_start_message = PullerStartMessage('system', 'puller_test', fake_db, fake_filter, False, batch_size=10)
+        system.ask(actor, puller_start_message)
+
+        for report in content:
+            assert recv_from_pipe(dummy_pipe_out, 2) == ('dispatcher', report)
+        _, msg = recv_from_pipe(dummy_pipe_out, 2)
+        assert isinstance(msg, EndMessage)
+
+    @define_database_content([REPORT1, REPORT2])
+    def test_start_actor_in_report_batch_mode_with_db_that_contains_2_report_make_actor_send_one_ReportBatch_to_dispatcher(self, system, actor, fake_db, fake_filter, content, dummy_pipe_out):
+        puller_start_message = PullerStartMessage('system', 'puller_test', fake_db, fake_filter, False,
+                                                  report_batch=True)
+        system.ask(actor, puller_start_message)
+
+        _, msg = recv_from_pipe(dummy_pipe_out, 2)
+        assert isinstance(msg, ReportBatch)
+        assert msg.reports == content
+        _, msg = recv_from_pipe(dummy_pipe_out, 2)
+        assert isinstance(msg, EndMessage)
+
+    def test_start_actor_with_max_interval_lower_than_min_interval_must_answer_error_message(self, system, actor, fake_db, fake_filter):
+        puller_start_message = PullerStartMessage('system', 'puller_test', fake_db, fake_filter, True, min_interval=1,
+                                                  max_interval=0.5)
+        answer = system.ask(actor, puller_start_message)
+        assert isinstance(answer, ErrorMessage)
+        assert answer.error_message == 'invalid pull batch configuration'
+
     def test_starting_actor_in_non_stream_mode_make_it_terminate_itself_after_empty_db(self, system, started_actor):
         time.sleep(1)
         assert not is_actor_alive(system, started_actor)
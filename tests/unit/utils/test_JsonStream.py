@@ -128,3 +128,38 @@ def test_read_json_object_twice_from_a_socket_with_two_json_object_must_return_t
     asyncio.get_event_loop().run_until_complete(future)
     assert future.result() is None
 
+
+
+def test_read_json_objects_from_a_socket_with_two_json_object_must_return_two_json_string_in_one_call():
+    json1 = '{"a":1}'
+    json2 = '{"b":{"c":2}}'
+    socket = MockedStreamReader(json1 + json2)
+    stream = JsonStream(socket)
+
+    future = asyncio.ensure_future(stream.read_json_objects())
+    asyncio.get_event_loop().run_until_complete(future)
+    assert future.result() == [json1, json2]
+
+
+def test_read_json_object_with_brackets_and_escaped_quotes_in_strings_must_return_the_whole_json_string():
+    json_string = '{"a":"}{","b":"\\"}\\""}'
+    socket = MockedStreamReader(json_string)
+    stream = JsonStream(socket)
+
+    future = asyncio.ensure_future(stream.read_json_object())
+    asyncio.get_event_loop().run_until_complete(future)
+    assert future.result() == json_string
+
+
+def test_read_json_object_split_between_two_reads_must_return_the_json_string_after_second_read():
+    json_string = '{"a":{"b":"x\\"}"}}'
+    socket = MockedStreamReader(json_string)
+    stream = JsonStream(socket, buffer_size=9)
+
+    future = asyncio.ensure_future(stream.read_json_object())
+    asyncio.get_event_loop().run_until_complete(future)
+    assert future.result() is None
+
+    future = asyncio.ensure_future(stream.read_json_object())
+    asyncio.get_event_loop().run_until_complete(future)
+    assert future.result() == json_string
@@ -186,3 +186,38 @@ class TestNode():
         childs = root.get_childs()
         childs.sort()
         assert childs == [(['A', 'B', 'C'], 1), (['A', 'B', 'C'], 2)]
+
+
+def test_remove_leaf_from_tree_remove_empty_nodes():
+    tree = Tree()
+    tree.add(['A', 'B', 'C'], 1)
+    tree.add(['A', 'D', 'E'], 2)
+
+    tree.remove(['A', 'B', 'C'])
+    assert tree.get(['A']) == [2]
+    assert [child.label for child in tree.root.childs] == ['D']
+
+    tree.remove(['A', 'D', 'E'])
+    assert tree.get([]) == []
+
+
+def test_remove_unknow_leaf_from_tree_raise_KeyError():
+    tree = Tree()
+    tree.add(['A', 'B', 'C'], 1)
+    with pytest.raises(KeyError):
+        tree.remove(['A', 'B'])
+    with pytest.raises(KeyError):
+        tree.remove(['A', 'B', 'D'])
+
+
+def test_get_leafs_after_adding_leaf_return_new_leaf():
+    tree = Tree()
+    tree.add(['A', 'B', 'C'], 1)
+    assert tree.get(['A']) == [1]
+    assert tree.get(['A', 'B']) == [1]
+
+    tree.add(['A', 'B', 'D'], 2)
+    tree.add(['A', 'E', 'F'], 3)
+    assert sorted(tree.get(['A'])) == [1, 2, 3]
+    assert sorted(tree.get(['A', 'B'])) == [1, 2]
+    assert tree.get(['A', 'E']) == [3]